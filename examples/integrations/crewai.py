@@ -0,0 +1,237 @@
+"""CrewAI + Sandchest: run agent-generated commands inside a Sandchest sandbox.
+
+Requires:
+    pip install crewai requests
+
+Set SANDCHEST_API_KEY in your environment, then:
+    python examples/integrations/crewai.py
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import random
+import threading
+import time
+from typing import Iterator
+
+import requests
+from requests.adapters import HTTPAdapter
+from crewai import Agent, Crew, Task
+from crewai.tools import tool
+
+API_BASE = os.environ.get("SANDCHEST_API_BASE", "https://api.sandchest.com")
+
+
+class SandchestClient:
+    """Minimal Sandchest API client for the example.
+
+    A single ``requests.Session`` is shared across every call so that all
+    requests reuse pooled keep-alive connections instead of paying a fresh
+    TCP + TLS handshake per call.
+    """
+
+    def __init__(self) -> None:
+        self.api_key = os.environ["SANDCHEST_API_KEY"]
+        self.sandbox_id: str | None = None
+        self._ready = False
+        self._ready_lock = threading.Lock()
+        self._ready_event = threading.Event()
+        self._ready_failure: Exception | None = None
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0),
+        )
+
+    def create_sandbox(self) -> str:
+        res = self._session.post(
+            f"{API_BASE}/v1/sandboxes",
+            json={"image": "ubuntu", "profile": "small"},
+            timeout=30,
+        )
+        res.raise_for_status()
+        self.sandbox_id = res.json()["sandbox_id"]
+        return self.sandbox_id
+
+    def _ensure_ready(self) -> None:
+        # Single-flight over the whole create + wait sequence: exactly one
+        # thread POSTs /v1/sandboxes and polls it to readiness; the rest
+        # block on the shared event. Coalescing only the polling loop would
+        # let racing callers each create a billable sandbox, all but one of
+        # them leaked.
+        if self._ready:
+            return
+        if not self._ready_lock.acquire(blocking=False):
+            # A creation is already in flight; wait for its outcome.
+            if not self._ready_event.wait(timeout=60):
+                raise TimeoutError("sandbox did not become ready within 60s")
+            if self._ready_failure is not None:
+                raise RuntimeError(
+                    "sandbox provisioning failed in another thread"
+                ) from self._ready_failure
+            return
+        try:
+            # Re-check under the lock: a previous winner may have finished
+            # while we raced for it.
+            if self._ready:
+                return
+            self._ready_event.clear()
+            self._ready_failure = None
+            try:
+                self.create_sandbox()
+                self._wait_ready()
+                self._ready = True
+            except Exception as exc:
+                self._ready_failure = exc
+                raise
+            finally:
+                # Wake waiters on failure too; otherwise they sit out the
+                # full timeout and report a misleading TimeoutError.
+                self._ready_event.set()
+        finally:
+            self._ready_lock.release()
+
+    def _wait_ready(self) -> None:
+        # Poll aggressively at first (fast boots are the common case),
+        # then back off exponentially toward a 1 s ceiling. The first
+        # poll runs immediately since the create call may already have
+        # flipped the sandbox to running.
+        deadline = time.monotonic() + 60
+        delay = 0.05
+        while time.monotonic() < deadline:
+            res = self._session.get(
+                f"{API_BASE}/v1/sandboxes/{self.sandbox_id}",
+                timeout=10,
+            )
+            res.raise_for_status()
+            status = res.json()["status"]
+            if status == "running":
+                return
+            if status in ("failed", "stopped"):
+                raise RuntimeError(f"sandbox entered terminal state: {status}")
+            time.sleep(delay + random.random() * delay * 0.25)
+            delay = min(delay * 1.6, 1.0)
+        raise TimeoutError("sandbox did not become ready within 60s")
+
+    def exec(self, cmd: str, timeout_seconds: int = 120) -> dict:
+        # _ready is cached after the first successful wait so repeated tool
+        # invocations skip any status reconfirmation round-trip.
+        self._ensure_ready()
+        res = self._session.post(
+            f"{API_BASE}/v1/sandboxes/{self.sandbox_id}/exec",
+            json={"cmd": cmd, "timeout_seconds": timeout_seconds, "wait": True},
+            timeout=timeout_seconds + 30,
+        )
+        res.raise_for_status()
+        return res.json()
+
+    def exec_stream(self, cmd: str, timeout_seconds: int = 120) -> Iterator[dict]:
+        """Run a command and yield output events as they arrive.
+
+        Streams the ND-JSON response line by line instead of buffering the
+        whole body, so commands with megabytes of stdout never hold
+        bytes + decoded str + dict in memory at once.
+        """
+        self._ensure_ready()
+        res = self._session.post(
+            f"{API_BASE}/v1/sandboxes/{self.sandbox_id}/exec",
+            json={"cmd": cmd, "timeout_seconds": timeout_seconds, "stream": True},
+            headers={"Accept": "application/x-ndjson"},
+            stream=True,
+            timeout=timeout_seconds + 30,
+        )
+        res.raise_for_status()
+        for line in res.iter_lines():
+            if line:
+                yield json.loads(line)
+
+    def stop(self) -> None:
+        if not self.sandbox_id:
+            return
+        self._session.post(
+            f"{API_BASE}/v1/sandboxes/{self.sandbox_id}/stop",
+            timeout=30,
+        )
+        self.sandbox_id = None
+        self._ready = False
+        self._ready_event.clear()
+
+    def close(self) -> None:
+        self._session.close()
+
+
+_client = SandchestClient()
+# Ensure the sandbox is stopped even when an exception escapes main() —
+# leaked sandboxes are TTL-bounded but billable until then.
+atexit.register(_client.stop)
+
+_RUNNERS = {
+    ".py": "python3",
+    ".js": "node",
+    ".sh": "bash",
+    ".rb": "ruby",
+}
+
+
+@tool("Execute a shell command in the sandbox")
+def execute_command(command: str) -> str:
+    """Run a shell command inside the Sandchest sandbox and return its output."""
+    result = _client.exec(command)
+    output = result.get("stdout", "")
+    if result.get("exit_code", 0) != 0:
+        output += f"\n[exit code {result['exit_code']}] {result.get('stderr', '')}"
+    return output
+
+
+@tool("Write a file and run it in the sandbox")
+def write_and_run_code(filename: str, code: str) -> str:
+    """Write `code` to `filename` in the sandbox and execute it."""
+    ext = os.path.splitext(filename)[1]
+    runner = _RUNNERS.get(ext)
+    if runner is None:
+        return f"unsupported file extension: {ext}"
+    heredoc = f"cat > {filename} << 'SANDCHEST_EOF'\n{code}\nSANDCHEST_EOF"
+    write_result = _client.exec(heredoc)
+    if write_result.get("exit_code", 0) != 0:
+        return f"failed to write file: {write_result.get('stderr', '')}"
+    run_result = _client.exec(f"{runner} {filename}")
+    output = run_result.get("stdout", "")
+    if run_result.get("exit_code", 0) != 0:
+        output += f"\n[exit code {run_result['exit_code']}] {run_result.get('stderr', '')}"
+    return output
+
+
+def main() -> None:
+    coder = Agent(
+        role="Software Engineer",
+        goal="Write and verify small programs in an isolated sandbox",
+        backstory="A careful engineer who always runs code before shipping it.",
+        tools=[execute_command, write_and_run_code],
+    )
+    task = Task(
+        description=(
+            "Write a Python script that prints the first 10 Fibonacci numbers, "
+            "run it in the sandbox, and report the output."
+        ),
+        expected_output="The script's stdout showing the first 10 Fibonacci numbers.",
+        agent=coder,
+    )
+    crew = Crew(agents=[coder], tasks=[task])
+    try:
+        result = crew.kickoff()
+        print(result)
+    finally:
+        _client.stop()
+        _client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2 @@
+# Makes the in-tree `sandchest` package importable when running pytest
+# from this directory without an editable install.
@@ -0,0 +1,57 @@
+"""Sandchest Python SDK."""
+
+from .async_client import AsyncSandchest
+from .async_http import AsyncHttpClient
+from .async_sandbox import AsyncSandbox
+from .async_session import AsyncSession
+from .client import Sandchest
+from .errors import (
+    AuthenticationError,
+    ConnectionError,
+    NotFoundError,
+    RateLimitError,
+    SandboxNotRunningError,
+    SandchestError,
+    ValidationError,
+)
+from .sandbox import Sandbox
+from .session import Session
+from .stream import ExecStream, aparse_sse, parse_sse
+from .types import (
+    Artifact,
+    ExecResult,
+    ExecResultBytes,
+    FileEntry,
+    ForkTree,
+    ForkTreeNode,
+    RegisterArtifactsResult,
+)
+
+__version__ = "0.1.0"
+
+__all__ = [
+    "Artifact",
+    "AsyncHttpClient",
+    "AsyncSandbox",
+    "AsyncSandchest",
+    "AsyncSession",
+    "AuthenticationError",
+    "ConnectionError",
+    "ExecResult",
+    "ExecResultBytes",
+    "ExecStream",
+    "FileEntry",
+    "ForkTree",
+    "ForkTreeNode",
+    "NotFoundError",
+    "RateLimitError",
+    "RegisterArtifactsResult",
+    "Sandbox",
+    "SandboxNotRunningError",
+    "Sandchest",
+    "SandchestError",
+    "Session",
+    "ValidationError",
+    "aparse_sse",
+    "parse_sse",
+]
@@ -0,0 +1,119 @@
+"""Async top-level Sandchest client."""
+
+from __future__ import annotations
+
+import os
+from typing import Mapping
+
+from .async_http import AsyncHttpClient
+from .async_sandbox import AsyncSandbox
+from .errors import AuthenticationError
+from .http import DEFAULT_BASE_URL, DEFAULT_RETRIES, DEFAULT_TIMEOUT_S
+from .sandbox import DEFAULT_WAIT_TIMEOUT_MS
+
+
+class AsyncSandchest:
+    """Async entry point for the Sandchest API.
+
+    Sandbox operations are independent I/O, so an async client lets callers
+    fan them out::
+
+        async with AsyncSandchest() as client:
+            sandboxes = await asyncio.gather(*[client.create() for _ in range(8)])
+
+    All N creates share one pooled HTTP/2 connection, so total wall time is
+    on the order of the slowest boot rather than the sum of round-trips.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        *,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = DEFAULT_TIMEOUT_S,
+        retries: int = DEFAULT_RETRIES,
+    ) -> None:
+        api_key = api_key or os.environ.get("SANDCHEST_API_KEY")
+        if not api_key:
+            raise AuthenticationError(
+                "no API key provided; pass api_key= or set SANDCHEST_API_KEY"
+            )
+        self._http = AsyncHttpClient(
+            api_key=api_key, base_url=base_url, timeout=timeout, retries=retries
+        )
+
+    async def __aenter__(self) -> "AsyncSandchest":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        await self.close()
+        return False
+
+    async def create(
+        self,
+        *,
+        image: str = "ubuntu",
+        profile: str = "small",
+        env: Mapping[str, str] | None = None,
+        wait_ready: bool = True,
+        wait_timeout_ms: int = DEFAULT_WAIT_TIMEOUT_MS,
+    ) -> AsyncSandbox:
+        """Create a sandbox, by default blocking until it is running."""
+        res = await self._http.request(
+            "POST",
+            "/v1/sandboxes",
+            body={
+                "image": image,
+                "profile": profile,
+                "env": dict(env) if env else None,
+            },
+        )
+        sandbox = AsyncSandbox(
+            self._http,
+            res["sandbox_id"],
+            status=res["status"],
+            replay_url=res.get("replay_url"),
+        )
+        if wait_ready and sandbox.status != "running":
+            await sandbox.wait_ready(timeout_ms=wait_timeout_ms)
+        return sandbox
+
+    async def get(self, sandbox_id: str) -> AsyncSandbox:
+        """Fetch an existing sandbox by ID."""
+        res = await self._http.request("GET", f"/v1/sandboxes/{sandbox_id}")
+        return AsyncSandbox(
+            self._http,
+            res["sandbox_id"],
+            status=res["status"],
+            replay_url=res.get("replay_url"),
+        )
+
+    async def list(
+        self, *, status: str | None = None, limit: int = 100
+    ) -> list[AsyncSandbox]:
+        """List sandboxes, following pagination until exhausted."""
+        sandboxes: list[AsyncSandbox] = []
+        cursor: str | None = None
+        while True:
+            res = await self._http.request(
+                "GET",
+                "/v1/sandboxes",
+                query={"status": status, "limit": limit, "cursor": cursor},
+            )
+            for item in res["sandboxes"]:
+                sandboxes.append(
+                    AsyncSandbox(
+                        self._http,
+                        item["sandbox_id"],
+                        status=item["status"],
+                        replay_url=item.get("replay_url"),
+                    )
+                )
+            cursor = res.get("next_cursor")
+            if cursor is None:
+                break
+        return sandboxes
+
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._http.close()
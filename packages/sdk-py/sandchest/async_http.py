@@ -0,0 +1,325 @@
+"""Async HTTP transport mirroring :mod:`sandchest.http`."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Iterable, Mapping
+
+import httpx
+
+from .errors import ConnectionError
+from .http import (
+    DEFAULT_BASE_URL,
+    DEFAULT_RETRIES,
+    DEFAULT_TIMEOUT_S,
+    ETAG_CACHE_SIZE,
+    MAX_REQUEST_WALL_TIME_S,
+    _MUTATION_METHODS,
+    _PendingError,
+    _build_params,
+    _classify_error_response,
+    _dumps,
+    _generate_idempotency_key,
+    _loads,
+    _materialize_error,
+    _retry_delay,
+    _should_retry,
+)
+
+
+class _AsyncStreamingResponse:
+    """Async twin of :class:`sandchest.http._StreamingResponse`."""
+
+    __slots__ = ("_response",)
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._response = response
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    async def aread(self) -> bytes:
+        try:
+            return await self._response.aread()
+        except httpx.TransportError as exc:
+            raise ConnectionError(str(exc)) from exc
+
+    async def aiter_bytes(
+        self, chunk_size: int | None = None
+    ) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._response.aiter_bytes(chunk_size):
+                yield chunk
+        except httpx.TransportError as exc:
+            raise ConnectionError(str(exc)) from exc
+
+
+class _AsyncStreamContext:
+    """Async twin of :class:`sandchest.http._StreamContext`."""
+
+    __slots__ = ("_cm",)
+
+    def __init__(self, cm) -> None:
+        self._cm = cm
+
+    async def __aenter__(self) -> _AsyncStreamingResponse:
+        try:
+            return _AsyncStreamingResponse(await self._cm.__aenter__())
+        except httpx.TransportError as exc:
+            raise ConnectionError(str(exc)) from exc
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return await self._cm.__aexit__(exc_type, exc, tb)
+
+
+class AsyncHttpClient:
+    """Async twin of :class:`~sandchest.http.HttpClient`.
+
+    Backed by ``httpx.AsyncClient`` with the same HTTP/2 + pool settings, so
+    N concurrent requests share one TCP+TLS handshake and multiplex streams.
+    Retry, backoff, error-parsing, and ETag-caching behavior are identical;
+    the pure helpers are shared with the sync module.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = DEFAULT_TIMEOUT_S,
+        retries: int = DEFAULT_RETRIES,
+    ) -> None:
+        self._api_key = api_key
+        self._base_url = base_url.rstrip("/")
+        self.retries = retries
+        self._auth_header = f"Bearer {api_key}"
+        self._json_headers = {
+            "Authorization": self._auth_header,
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        self._raw_headers = {"Authorization": self._auth_header}
+        self._etag_cache: OrderedDict[Any, tuple[str, Any]] = OrderedDict()
+        # Set by close(): retry waits race against this event instead of a
+        # bare sleep, so a shutting-down client unblocks immediately.
+        self._shutdown = asyncio.Event()
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            timeout=httpx.Timeout(timeout),
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=60.0,
+            ),
+        )
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: dict[str, Any] | None = None,
+        query: Mapping[str, Any] | None = None,
+        idempotency_key: str | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> Any:
+        """Async counterpart of :meth:`HttpClient.request`."""
+        is_mutation = method in _MUTATION_METHODS
+        params = _build_params(query)
+        # Serialized once up front: the encoded bytes are identical on every
+        # attempt, so retries must not pay for re-encoding the body.
+        content = _dumps(body) if body is not None else None
+        if idempotency_key is not None:
+            idem_key = idempotency_key
+        elif is_mutation:
+            idem_key = _generate_idempotency_key()
+        else:
+            idem_key = None
+        if method == "GET":
+            cache_key = (path, tuple(sorted(params)) if params else None)
+            cached = self._etag_cache.get(cache_key)
+        else:
+            cache_key = None
+            cached = None
+        if idem_key is None and cached is None and not headers:
+            request_headers = self._json_headers
+        else:
+            request_headers = dict(self._json_headers)
+            if idem_key is not None:
+                request_headers["Idempotency-Key"] = idem_key
+            if cached is not None:
+                request_headers["If-None-Match"] = cached[0]
+            if headers:
+                request_headers.update(headers)
+        # Fast path mirroring the sync client: one successful round-trip
+        # pays no retry-loop bookkeeping.
+        value, pending = await self._attempt(
+            method,
+            path,
+            content,
+            params,
+            request_headers,
+            cache_key,
+            cached,
+            allow_retry=self.retries > 0,
+        )
+        if pending is None:
+            return value
+        deadline = time.monotonic() + MAX_REQUEST_WALL_TIME_S
+        for attempt in range(1, self.retries + 1):
+            delay = _retry_delay(pending, attempt - 1)
+            if time.monotonic() + delay >= deadline:
+                raise _materialize_error(pending)
+            try:
+                await asyncio.wait_for(self._shutdown.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                raise ConnectionError("client closed while waiting to retry")
+            value, pending = await self._attempt(
+                method,
+                path,
+                content,
+                params,
+                request_headers,
+                cache_key,
+                cached,
+                allow_retry=attempt < self.retries,
+            )
+            if pending is None:
+                return value
+        raise _materialize_error(pending)
+
+    async def _attempt(
+        self,
+        method: str,
+        path: str,
+        content: bytes | None,
+        params: list[tuple[str, str]] | None,
+        request_headers: Mapping[str, str],
+        cache_key: Any,
+        cached: tuple[str, Any] | None,
+        allow_retry: bool,
+    ) -> tuple[Any, _PendingError | None]:
+        """Async counterpart of :meth:`HttpClient._attempt`."""
+        try:
+            response = await self._client.request(
+                method,
+                path,
+                headers=request_headers,
+                content=content,
+                params=params,
+            )
+        except httpx.TransportError as exc:
+            if allow_retry:
+                return None, (ConnectionError, {"message": str(exc)})
+            raise ConnectionError(str(exc)) from exc
+        # The status code drives every branch below; read it once instead of
+        # taking the attribute hit per comparison.
+        status = response.status_code
+        if status == 304 and cached is not None:
+            return cached[1], None
+        if status < 300:
+            if status == 204:
+                return None, None
+            parsed = _loads(response.content)
+            if cache_key is not None:
+                etag = response.headers.get("ETag")
+                if etag:
+                    self._etag_cache[cache_key] = (etag, parsed)
+                    self._etag_cache.move_to_end(cache_key)
+                    if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                        self._etag_cache.popitem(last=False)
+            return parsed, None
+        # Only failures pay for decoding the error envelope; the success path
+        # above never touches it.
+        error_body = self._try_parse_json(response)
+        message = (error_body or {}).get("message", f"HTTP {status}")
+        request_id = (error_body or {}).get("request_id") or response.headers.get(
+            "X-Request-Id"
+        )
+        pending = _classify_error_response(response, error_body, message, request_id)
+        if allow_retry and _should_retry(status):
+            return None, pending
+        raise _materialize_error(pending)
+
+    async def request_raw(
+        self,
+        method: str,
+        path: str,
+        *,
+        content: bytes | Iterable[bytes] | None = None,
+        query: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> httpx.Response:
+        """Async counterpart of :meth:`HttpClient.request_raw`."""
+        if headers:
+            merged_headers = {**self._raw_headers, **headers}
+        else:
+            merged_headers = self._raw_headers
+        try:
+            response = await self._client.request(
+                method,
+                path,
+                headers=merged_headers,
+                content=content,
+                params=_build_params(query),
+            )
+        except httpx.TransportError as exc:
+            raise ConnectionError(str(exc)) from exc
+        if not response.is_success:
+            error_body = self._try_parse_json(response)
+            message = (error_body or {}).get(
+                "message", f"HTTP {response.status_code}"
+            )
+            raise _materialize_error(
+                _classify_error_response(
+                    response,
+                    error_body,
+                    message,
+                    (error_body or {}).get("request_id"),
+                )
+            )
+        return response
+
+    def request_stream(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: dict[str, Any] | None = None,
+        query: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ):
+        """Open a streaming request; returns an async context manager.
+
+        Transport errors map to :class:`ConnectionError` on connect and on
+        mid-stream reads, mirroring the sync client.
+        """
+        if headers:
+            merged_headers = {**self._raw_headers, **headers}
+        else:
+            merged_headers = self._raw_headers
+        return _AsyncStreamContext(
+            self._client.stream(
+                method,
+                path,
+                headers=merged_headers,
+                params=_build_params(query),
+                json=body,
+            )
+        )
+
+    async def close(self) -> None:
+        self._shutdown.set()
+        await self._client.aclose()
+
+    @staticmethod
+    def _try_parse_json(response: httpx.Response) -> dict[str, Any] | None:
+        try:
+            parsed = _loads(response.content)
+        except ValueError:
+            return None
+        return parsed if isinstance(parsed, dict) else None
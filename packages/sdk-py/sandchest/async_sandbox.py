@@ -0,0 +1,148 @@
+"""Async sandbox handle mirroring :class:`~sandchest.sandbox.Sandbox`."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import AsyncIterator, Mapping
+
+from .async_http import AsyncHttpClient
+from .async_session import AsyncSession
+from .errors import SandboxNotRunningError, SandchestError
+from .sandbox import (
+    DEFAULT_EXEC_TIMEOUT_S,
+    DEFAULT_WAIT_TIMEOUT_MS,
+    WAIT_READY_BACKOFF,
+    WAIT_READY_MAX_POLL_S,
+    WAIT_READY_MIN_POLL_S,
+    Sandbox,
+)
+from .stream import aparse_sse
+from .types import ExecResult, ExecStreamEvent
+
+
+class AsyncSandbox:
+    """Awaitable sandbox handle for fan-out workloads.
+
+    Many sandboxes can be created, waited on, and exec'd concurrently from
+    one event loop via ``asyncio.gather``, overlapping every round-trip.
+    """
+
+    def __init__(
+        self,
+        http: AsyncHttpClient,
+        sandbox_id: str,
+        status: str = "pending",
+        replay_url: str | None = None,
+    ) -> None:
+        self._http = http
+        self.id = sandbox_id
+        self.status = status
+        self.replay_url = replay_url
+
+    async def __aenter__(self) -> "AsyncSandbox":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if self.status == "running":
+            await self.stop()
+        return False
+
+    async def wait_ready(
+        self, timeout_ms: int = DEFAULT_WAIT_TIMEOUT_MS
+    ) -> "AsyncSandbox":
+        """Poll until the sandbox is ``running``; raise on terminal states."""
+        deadline = time.monotonic() + timeout_ms / 1000
+        delay = WAIT_READY_MIN_POLL_S
+        while True:
+            res = await self._http.request("GET", f"/v1/sandboxes/{self.id}")
+            self.status = res["status"]
+            if self.status == "running":
+                return self
+            if self.status in ("failed", "stopped"):
+                raise SandboxNotRunningError(
+                    f"sandbox {self.id} entered terminal state {self.status!r}"
+                    f" ({res.get('failure_reason')})"
+                )
+            if time.monotonic() >= deadline:
+                raise SandchestError(
+                    f"sandbox {self.id} was not ready after {timeout_ms}ms"
+                )
+            await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(delay * WAIT_READY_BACKOFF, WAIT_READY_MAX_POLL_S)
+
+    async def exec(
+        self,
+        cmd: str,
+        *,
+        cwd: str | None = None,
+        env: Mapping[str, str] | None = None,
+        timeout: int = DEFAULT_EXEC_TIMEOUT_S,
+    ) -> ExecResult:
+        """Run a command and wait for it to finish."""
+        res = await self._http.request(
+            "POST",
+            f"/v1/sandboxes/{self.id}/exec",
+            body=Sandbox._exec_body(cmd, cwd, env, timeout, True),
+        )
+        return ExecResult.from_api(res)
+
+    async def exec_stream(
+        self,
+        cmd: str,
+        *,
+        cwd: str | None = None,
+        env: Mapping[str, str] | None = None,
+        timeout: int = DEFAULT_EXEC_TIMEOUT_S,
+    ) -> AsyncIterator[ExecStreamEvent]:
+        """Run a command, yielding output events as they arrive."""
+        res = await self._http.request(
+            "POST",
+            f"/v1/sandboxes/{self.id}/exec",
+            body=Sandbox._exec_body(cmd, cwd, env, timeout, False),
+        )
+        exec_id = res["exec_id"]
+        async with self._http.request_stream(
+            "GET",
+            f"/v1/sandboxes/{self.id}/exec/{exec_id}/stream",
+            headers={"Accept": "text/event-stream"},
+        ) as response:
+            async for event in aparse_sse(response):
+                yield event
+
+    async def fork(self) -> "AsyncSandbox":
+        """Clone this sandbox's filesystem and memory into a new sandbox."""
+        res = await self._http.request("POST", f"/v1/sandboxes/{self.id}/fork")
+        return AsyncSandbox(
+            self._http,
+            res["sandbox_id"],
+            status=res["status"],
+            replay_url=res.get("replay_url"),
+        )
+
+    async def create_session(
+        self,
+        *,
+        cwd: str | None = None,
+        env: Mapping[str, str] | None = None,
+    ) -> AsyncSession:
+        """Start a persistent shell session in the sandbox."""
+        res = await self._http.request(
+            "POST",
+            f"/v1/sandboxes/{self.id}/sessions",
+            body={"cwd": cwd, "env": dict(env) if env else None},
+        )
+        return AsyncSession(self._http, self.id, res["session_id"])
+
+    async def refresh(self) -> "AsyncSandbox":
+        """Re-fetch sandbox state from the API."""
+        res = await self._http.request("GET", f"/v1/sandboxes/{self.id}")
+        self.status = res["status"]
+        self.replay_url = res.get("replay_url")
+        return self
+
+    async def stop(self) -> None:
+        """Stop the sandbox. Stopped sandboxes cannot be restarted."""
+        await self._http.request("DELETE", f"/v1/sandboxes/{self.id}")
+        self.status = "stopped"
@@ -0,0 +1,46 @@
+"""Async persistent shell sessions mirroring :class:`~sandchest.session.Session`."""
+
+from __future__ import annotations
+
+from .async_http import AsyncHttpClient
+from .session import DEFAULT_EXEC_TIMEOUT_S
+from .types import ExecResult
+
+
+class AsyncSession:
+    """Awaitable twin of :class:`~sandchest.session.Session`.
+
+    Shell state persists between ``exec`` calls exactly as in the sync
+    version. Obtain one via :meth:`AsyncSandbox.create_session`.
+    """
+
+    def __init__(
+        self, http: AsyncHttpClient, sandbox_id: str, session_id: str
+    ) -> None:
+        self._http = http
+        self.sandbox_id = sandbox_id
+        self.id = session_id
+
+    async def __aenter__(self) -> "AsyncSession":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        await self.close()
+        return False
+
+    async def exec(
+        self, cmd: str, *, timeout: int = DEFAULT_EXEC_TIMEOUT_S
+    ) -> ExecResult:
+        """Run a command in the session and wait for it to finish."""
+        res = await self._http.request(
+            "POST",
+            f"/v1/sandboxes/{self.sandbox_id}/sessions/{self.id}/exec",
+            body={"cmd": cmd, "timeout_seconds": timeout, "wait": True},
+        )
+        return ExecResult.from_api(res)
+
+    async def close(self) -> None:
+        """Terminate the session's shell process."""
+        await self._http.request(
+            "DELETE", f"/v1/sandboxes/{self.sandbox_id}/sessions/{self.id}"
+        )
@@ -0,0 +1,167 @@
+"""Top-level Sandchest API client."""
+
+from __future__ import annotations
+
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Iterable, Iterator, Mapping
+
+from .errors import AuthenticationError
+from .http import DEFAULT_BASE_URL, DEFAULT_RETRIES, DEFAULT_TIMEOUT_S, HttpClient
+from .sandbox import DEFAULT_WAIT_TIMEOUT_MS, Sandbox
+
+# C-level extractor for the list() loop; see the matching constants in
+# sandbox.py.
+_SANDBOX_FIELDS = itemgetter("sandbox_id", "status")
+
+
+class Sandchest:
+    """Entry point for the Sandchest API.
+
+    Reuse a single instance for all operations — every sandbox and session it
+    returns shares one pooled HTTP transport, so per-call connection setup is
+    amortized away.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        *,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = DEFAULT_TIMEOUT_S,
+        retries: int = DEFAULT_RETRIES,
+        poll_interval: float | None = None,
+    ) -> None:
+        api_key = api_key or os.environ.get("SANDCHEST_API_KEY")
+        if not api_key:
+            raise AuthenticationError(
+                "no API key provided; pass api_key= or set SANDCHEST_API_KEY"
+            )
+        self._http = HttpClient(
+            api_key=api_key, base_url=base_url, timeout=timeout, retries=retries
+        )
+        # Fixed wait_ready poll interval in seconds; None means the adaptive
+        # backoff schedule. SANDCHEST_POLL_INTERVAL_MS lets deployments tune
+        # the latency/API-load tradeoff without code changes.
+        if poll_interval is None:
+            env_ms = os.environ.get("SANDCHEST_POLL_INTERVAL_MS")
+            if env_ms:
+                poll_interval = float(env_ms) / 1000
+        self._poll_interval_s = poll_interval
+        # Identity map: get/list return the same Sandbox instance for a
+        # given ID, preserving client-side state across lookups. Weak values
+        # let GC reclaim sandboxes the caller no longer references.
+        self._sandboxes: weakref.WeakValueDictionary[str, Sandbox] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def _intern(
+        self, sandbox_id: str, status: str, replay_url: str | None
+    ) -> Sandbox:
+        sandbox = self._sandboxes.get(sandbox_id)
+        if sandbox is None:
+            sandbox = Sandbox(
+                self._http,
+                sandbox_id,
+                status=status,
+                replay_url=replay_url,
+                poll_interval_s=self._poll_interval_s,
+            )
+            self._sandboxes[sandbox_id] = sandbox
+        else:
+            sandbox.status = status
+            if replay_url is not None:
+                sandbox.replay_url = replay_url
+        return sandbox
+
+    def __enter__(self) -> "Sandchest":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+    def create(
+        self,
+        *,
+        image: str = "ubuntu",
+        profile: str = "small",
+        env: Mapping[str, str] | None = None,
+        wait_ready: bool = True,
+        wait_timeout_ms: int = DEFAULT_WAIT_TIMEOUT_MS,
+    ) -> Sandbox:
+        """Create a sandbox, by default blocking until it is running."""
+        res = self._http.request(
+            "POST",
+            "/v1/sandboxes",
+            body={
+                "image": image,
+                "profile": profile,
+                "env": dict(env) if env else None,
+            },
+        )
+        sandbox = self._intern(
+            res["sandbox_id"], res["status"], res.get("replay_url")
+        )
+        if wait_ready and sandbox.status != "running":
+            sandbox.wait_ready(timeout_ms=wait_timeout_ms)
+        return sandbox
+
+    def get(self, sandbox_id: str) -> Sandbox:
+        """Fetch an existing sandbox by ID."""
+        res = self._http.request("GET", f"/v1/sandboxes/{sandbox_id}")
+        return self._intern(
+            res["sandbox_id"], res["status"], res.get("replay_url")
+        )
+
+    def iter_sandboxes(
+        self, *, status: str | None = None, limit: int = 100
+    ) -> Iterator[Sandbox]:
+        """Lazily iterate sandboxes, fetching pages on demand.
+
+        Callers that break out early never pay for the remaining pages;
+        memory stays flat regardless of fleet size.
+        """
+        cursor: str | None = None
+        while True:
+            res = self._http.request(
+                "GET",
+                "/v1/sandboxes",
+                query={"status": status, "limit": limit, "cursor": cursor},
+            )
+            for item in res["sandboxes"]:
+                yield self._intern(*_SANDBOX_FIELDS(item), item.get("replay_url"))
+            cursor = res.get("next_cursor")
+            if cursor is None:
+                return
+
+    def list(
+        self, *, status: str | None = None, limit: int = 100
+    ) -> list[Sandbox]:
+        """List sandboxes, following pagination until exhausted."""
+        return list(self.iter_sandboxes(status=status, limit=limit))
+
+    def stop_many(
+        self, sandboxes: Iterable[Sandbox], *, max_concurrency: int = 16
+    ) -> None:
+        """Stop several sandboxes concurrently.
+
+        Each stop is an independent round-trip, so fanning them out across
+        a thread pool makes tearing down N sandboxes cost roughly one RTT
+        instead of N. The pooled transport already supports this level of
+        concurrency.
+        """
+        sandboxes = list(sandboxes)
+        if not sandboxes:
+            return
+        workers = min(max_concurrency, len(sandboxes))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(sb.stop) for sb in sandboxes]
+            for future in futures:
+                future.result()
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._http.close()
@@ -0,0 +1,54 @@
+"""Exception types raised by the Sandchest SDK."""
+
+from __future__ import annotations
+
+
+class SandchestError(Exception):
+    """Base class for every error raised by the SDK."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        status: int | None = None,
+        request_id: str | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.message = message
+        self.status = status
+        self.request_id = request_id
+
+
+class ValidationError(SandchestError):
+    """The request was rejected by server-side validation (HTTP 400)."""
+
+
+class AuthenticationError(SandchestError):
+    """The API key is missing, malformed, or revoked (HTTP 401)."""
+
+
+class NotFoundError(SandchestError):
+    """The sandbox, session, or file does not exist (HTTP 404)."""
+
+
+class SandboxNotRunningError(SandchestError):
+    """The operation requires a running sandbox (HTTP 409)."""
+
+
+class RateLimitError(SandchestError):
+    """Too many requests (HTTP 429)."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        status: int | None = None,
+        request_id: str | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        super().__init__(message, status=status, request_id=request_id)
+        self.retry_after = retry_after
+
+
+class ConnectionError(SandchestError):
+    """The request never reached the API (DNS, TCP, or TLS failure)."""
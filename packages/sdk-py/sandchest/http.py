@@ -0,0 +1,488 @@
+"""HTTP transport shared by every Sandchest SDK object."""
+
+from __future__ import annotations
+
+import itertools
+import json
+import random
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Iterable, Iterator, Mapping
+
+import httpx
+
+from .errors import (
+    AuthenticationError,
+    ConnectionError,
+    NotFoundError,
+    RateLimitError,
+    SandboxNotRunningError,
+    SandchestError,
+    ValidationError,
+)
+
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _loads = json.loads
+
+DEFAULT_BASE_URL = "https://api.sandchest.com"
+DEFAULT_TIMEOUT_S = 30.0
+DEFAULT_RETRIES = 2
+MAX_RATE_LIMIT_WAIT_S = 60.0
+MAX_REQUEST_WALL_TIME_S = 120.0
+ETAG_CACHE_SIZE = 128
+
+_MUTATION_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+def _generate_idempotency_key() -> str:
+    return secrets.token_hex(16)
+
+
+# Backoff jitter comes from a table precomputed at import: retries can fire
+# from many threads at once and indexing a tuple is cheaper than a
+# random.random() call per retry.
+_JITTER_TABLE = tuple(random.random() for _ in range(256))
+_jitter_idx = itertools.cycle(range(256))
+
+
+def _backoff_delay(attempt: int) -> float:
+    base = 1 << min(attempt, 5)  # 1, 2, 4, 8, 16, 32 seconds
+    if base > 30:
+        base = 30
+    return base + _JITTER_TABLE[next(_jitter_idx)] * base * 0.5
+
+
+def _should_retry(status: int) -> bool:
+    return status == 429 or 500 <= status < 600
+
+
+# Retryable failures are tracked as (error class, constructor kwargs) pairs
+# so the exception object — with its traceback machinery — is only built if
+# the request ultimately fails. Attempts that get retried never pay for it.
+_PendingError = tuple[type[SandchestError], dict[str, Any]]
+
+
+def _materialize_error(pending: _PendingError) -> SandchestError:
+    cls, kwargs = pending
+    return cls(**kwargs)
+
+
+def _retry_delay(pending: _PendingError, attempt: int) -> float:
+    """Delay before retry ``attempt`` (0-based), honoring rate-limit hints.
+
+    The server-controlled ``retry_after`` is clamped so one hostile header
+    cannot pin the client, and jittered +-20% so fleets of clients do not
+    retry in lockstep.
+    """
+    cls, kwargs = pending
+    if cls is RateLimitError and kwargs.get("retry_after") is not None:
+        delay = min(max(kwargs["retry_after"], 0.1), MAX_RATE_LIMIT_WAIT_S)
+        return delay * (0.8 + 0.4 * random.random())
+    return _backoff_delay(attempt)
+
+
+def _build_params(
+    query: Mapping[str, Any] | None,
+) -> list[tuple[str, str]] | None:
+    if not query:
+        return None
+    out: list[tuple[str, str]] = []
+    for k, v in query.items():
+        if v is None:
+            continue
+        if isinstance(v, bool):
+            out.append((k, "true" if v else "false"))
+        elif isinstance(v, Enum):
+            out.append((k, v.value))
+        else:
+            out.append((k, str(v)))
+    return out or None
+
+
+# Status-to-exception mapping; one dict lookup replaces a chain of integer
+# comparisons on the error path. 429 stays special-cased for retry_after.
+_ERROR_TYPES: dict[int, type[SandchestError]] = {
+    400: ValidationError,
+    401: AuthenticationError,
+    404: NotFoundError,
+    409: SandboxNotRunningError,
+}
+
+
+def _classify_error_response(
+    response: httpx.Response,
+    error_body: dict[str, Any] | None,
+    message: str,
+    request_id: str | None,
+) -> _PendingError:
+    status = response.status_code
+    kwargs: dict[str, Any] = {
+        "message": message,
+        "status": status,
+        "request_id": request_id,
+    }
+    if status == 429:
+        retry_after = (error_body or {}).get("retry_after")
+        if retry_after is None:
+            header = response.headers.get("Retry-After")
+            retry_after = float(header) if header else None
+        kwargs["retry_after"] = retry_after
+        return RateLimitError, kwargs
+    return _ERROR_TYPES.get(status, SandchestError), kwargs
+
+
+class _StreamingResponse:
+    """Proxy over a streaming ``httpx.Response``.
+
+    Body reads re-raise transport errors as the SDK's
+    :class:`ConnectionError`, so the errors-module contract — connection
+    failures surface as ``ConnectionError`` — holds on streaming paths
+    exactly as it does for buffered requests. Everything else delegates to
+    the underlying response.
+    """
+
+    __slots__ = ("_response",)
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._response = response
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    def read(self) -> bytes:
+        try:
+            return self._response.read()
+        except httpx.TransportError as exc:
+            raise ConnectionError(str(exc)) from exc
+
+    def iter_bytes(self, chunk_size: int | None = None) -> Iterator[bytes]:
+        try:
+            yield from self._response.iter_bytes(chunk_size)
+        except httpx.TransportError as exc:
+            raise ConnectionError(str(exc)) from exc
+
+
+class _StreamContext:
+    """Context manager pairing ``httpx.Client.stream`` with error mapping.
+
+    Transport errors raised while opening the connection surface as
+    :class:`ConnectionError`, and the entered response is wrapped in
+    :class:`_StreamingResponse` so mid-stream reads map the same way.
+    """
+
+    __slots__ = ("_cm",)
+
+    def __init__(self, cm) -> None:
+        self._cm = cm
+
+    def __enter__(self) -> _StreamingResponse:
+        try:
+            return _StreamingResponse(self._cm.__enter__())
+        except httpx.TransportError as exc:
+            raise ConnectionError(str(exc)) from exc
+
+    def __exit__(self, exc_type, exc, tb):
+        return self._cm.__exit__(exc_type, exc, tb)
+
+
+class HttpClient:
+    """Thin wrapper around ``httpx.Client`` with auth, retries, and errors.
+
+    HTTP/2 is enabled so bursts of small sandbox/exec RPCs multiplex over a
+    single TLS connection to the API host, and the pool limits are raised so
+    concurrent callers do not stall waiting for a free socket. One
+    ``HttpClient`` should be shared across all sandboxes created by a
+    :class:`~sandchest.client.Sandchest` instance.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = DEFAULT_TIMEOUT_S,
+        retries: int = DEFAULT_RETRIES,
+    ) -> None:
+        self._api_key = api_key
+        self._base_url = base_url.rstrip("/")
+        self.retries = retries
+        # Precomputed once: rebuilding these dicts (and re-formatting the
+        # bearer token) per request is measurable interpreter overhead for
+        # callers issuing thousands of small RPCs.
+        self._auth_header = f"Bearer {api_key}"
+        self._json_headers = {
+            "Authorization": self._auth_header,
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        self._raw_headers = {"Authorization": self._auth_header}
+        # ETag cache for GETs: while a resource is unchanged (e.g. a sandbox
+        # sitting in "pending" between polls) the server answers 304 with no
+        # body and we reuse the parsed payload. LRU-bounded.
+        self._etag_cache: OrderedDict[Any, tuple[str, Any]] = OrderedDict()
+        # Set by close(): retry waits block on this event instead of
+        # time.sleep, so a shutting-down client unblocks immediately rather
+        # than sitting out the rest of a backoff delay.
+        self._shutdown = threading.Event()
+        self._client = httpx.Client(
+            base_url=self._base_url,
+            timeout=httpx.Timeout(timeout),
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=60.0,
+            ),
+        )
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: dict[str, Any] | None = None,
+        query: Mapping[str, Any] | None = None,
+        idempotency_key: str | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> Any:
+        """Issue a JSON request and return the decoded body (``None`` on 204).
+
+        Retries 429s and 5xx responses up to ``self.retries`` times with
+        exponential backoff, honoring the server's ``retry_after`` hint.
+        """
+        is_mutation = method in _MUTATION_METHODS
+        params = _build_params(query)
+        # Serialized once up front: the encoded bytes are identical on every
+        # attempt, so retries must not pay for re-encoding the body.
+        content = _dumps(body) if body is not None else None
+        # Generated once, outside the retry loop, so retried mutations
+        # deduplicate server-side; GETs never pay for key generation.
+        if idempotency_key is not None:
+            idem_key = idempotency_key
+        elif is_mutation:
+            idem_key = _generate_idempotency_key()
+        else:
+            idem_key = None
+        if method == "GET":
+            cache_key = (path, tuple(sorted(params)) if params else None)
+            cached = self._etag_cache.get(cache_key)
+        else:
+            cache_key = None
+            cached = None
+        if idem_key is None and cached is None and not headers:
+            request_headers = self._json_headers
+        else:
+            request_headers = dict(self._json_headers)
+            if idem_key is not None:
+                request_headers["Idempotency-Key"] = idem_key
+            if cached is not None:
+                request_headers["If-None-Match"] = cached[0]
+            if headers:
+                request_headers.update(headers)
+        # Fast path: a single successful round-trip is the overwhelmingly
+        # common case and pays no retry-loop bookkeeping.
+        value, pending = self._attempt(
+            method,
+            path,
+            content,
+            params,
+            request_headers,
+            cache_key,
+            cached,
+            allow_retry=self.retries > 0,
+        )
+        if pending is None:
+            return value
+        deadline = time.monotonic() + MAX_REQUEST_WALL_TIME_S
+        for attempt in range(1, self.retries + 1):
+            delay = _retry_delay(pending, attempt - 1)
+            if time.monotonic() + delay >= deadline:
+                raise _materialize_error(pending)
+            if self._shutdown.wait(delay):
+                raise ConnectionError("client closed while waiting to retry")
+            value, pending = self._attempt(
+                method,
+                path,
+                content,
+                params,
+                request_headers,
+                cache_key,
+                cached,
+                allow_retry=attempt < self.retries,
+            )
+            if pending is None:
+                return value
+        raise _materialize_error(pending)
+
+    def _attempt(
+        self,
+        method: str,
+        path: str,
+        content: bytes | None,
+        params: list[tuple[str, str]] | None,
+        request_headers: Mapping[str, str],
+        cache_key: Any,
+        cached: tuple[str, Any] | None,
+        allow_retry: bool,
+    ) -> tuple[Any, _PendingError | None]:
+        """Run one HTTP attempt.
+
+        Returns ``(value, None)`` on success, ``(None, pending_error)`` when
+        the failure is retryable and retries remain, and raises otherwise.
+        """
+        try:
+            response = self._client.request(
+                method,
+                path,
+                headers=request_headers,
+                content=content,
+                params=params,
+            )
+        except httpx.TransportError as exc:
+            if allow_retry:
+                return None, (ConnectionError, {"message": str(exc)})
+            raise ConnectionError(str(exc)) from exc
+        # The status code drives every branch below; read it once instead of
+        # taking the attribute hit per comparison.
+        status = response.status_code
+        if status == 304 and cached is not None:
+            return cached[1], None
+        if status < 300:
+            if status == 204:
+                return None, None
+            parsed = _loads(response.content)
+            if cache_key is not None:
+                etag = response.headers.get("ETag")
+                if etag:
+                    self._etag_cache[cache_key] = (etag, parsed)
+                    self._etag_cache.move_to_end(cache_key)
+                    if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                        self._etag_cache.popitem(last=False)
+            return parsed, None
+        # Only failures pay for decoding the error envelope; the success path
+        # above never touches it.
+        error_body = self._try_parse_json(response)
+        message = (error_body or {}).get("message", f"HTTP {status}")
+        request_id = (error_body or {}).get("request_id") or response.headers.get(
+            "X-Request-Id"
+        )
+        pending = _classify_error_response(response, error_body, message, request_id)
+        if allow_retry and _should_retry(status):
+            return None, pending
+        raise _materialize_error(pending)
+
+    def request_raw(
+        self,
+        method: str,
+        path: str,
+        *,
+        content: bytes | Iterable[bytes] | None = None,
+        query: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> httpx.Response:
+        """Issue a request with a raw body and return the raw response."""
+        if headers:
+            merged_headers = {**self._raw_headers, **headers}
+        else:
+            merged_headers = self._raw_headers
+        try:
+            response = self._client.request(
+                method,
+                path,
+                headers=merged_headers,
+                content=content,
+                params=_build_params(query),
+            )
+        except httpx.TransportError as exc:
+            raise ConnectionError(str(exc)) from exc
+        if not response.is_success:
+            error_body = self._try_parse_json_bytes(response.content)
+            message = (error_body or {}).get(
+                "message", f"HTTP {response.status_code}"
+            )
+            raise _materialize_error(
+                _classify_error_response(
+                    response,
+                    error_body,
+                    message,
+                    (error_body or {}).get("request_id"),
+                )
+            )
+        return response
+
+    def request_head(self, path: str) -> Mapping[str, str]:
+        """Issue a HEAD request and return the response headers.
+
+        For lightweight status polls where the interesting state rides in a
+        header and transferring plus parsing a body would be wasted work.
+        Failures never raise: a server without HEAD support (404/405), a
+        transient 429/5xx, or a network error all yield an empty mapping,
+        and the caller's full GET fallback surfaces real errors with the
+        usual retry and error mapping.
+        """
+        try:
+            response = self._client.request(
+                "HEAD", path, headers=self._raw_headers
+            )
+        except httpx.TransportError:
+            return {}
+        if not response.is_success:
+            return {}
+        return response.headers
+
+    def request_stream(
+        self,
+        method: str,
+        path: str,
+        *,
+        body: dict[str, Any] | None = None,
+        query: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ):
+        """Open a streaming request; returns a context manager.
+
+        The entered response maps transport errors — on connect and on
+        mid-stream reads — to :class:`ConnectionError` like every other
+        transport entry point.
+        """
+        if headers:
+            merged_headers = {**self._raw_headers, **headers}
+        else:
+            merged_headers = self._raw_headers
+        return _StreamContext(
+            self._client.stream(
+                method,
+                path,
+                headers=merged_headers,
+                params=_build_params(query),
+                json=body,
+            )
+        )
+
+    def close(self) -> None:
+        self._shutdown.set()
+        self._client.close()
+
+    @staticmethod
+    def _try_parse_json(response: httpx.Response) -> dict[str, Any] | None:
+        try:
+            parsed = _loads(response.content)
+        except ValueError:
+            return None
+        return parsed if isinstance(parsed, dict) else None
+
+    @staticmethod
+    def _try_parse_json_bytes(data: bytes) -> dict[str, Any] | None:
+        try:
+            parsed = _loads(data)
+        except ValueError:
+            return None
+        return parsed if isinstance(parsed, dict) else None
@@ -0,0 +1,520 @@
+"""Sandbox handle: exec, files, artifacts, forks, and lifecycle.
+
+Every method here goes through the owning client's pooled HTTP transport.
+Reuse one :class:`~sandchest.client.Sandchest` instance across sandboxes —
+short operations like ``ls``, ``rm``, and ``stop`` ride existing keep-alive
+connections, where a client-per-operation pays a TCP+TLS handshake each time.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from operator import itemgetter
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Mapping
+
+from .errors import ConnectionError, SandboxNotRunningError, SandchestError
+from .http import HttpClient, _loads
+from .session import Session
+from .stream import ExecStream, parse_sse
+from .types import (
+    Artifact,
+    ExecResult,
+    FileEntry,
+    ForkTree,
+    ForkTreeNode,
+    RegisterArtifactsResult,
+)
+
+# wait_ready polls on an exponential schedule: most sandboxes boot in well
+# under a second, so start tight and back off toward a 2 s ceiling for the
+# slow ones. Each delay is jittered so fleets of clients spread their polls.
+WAIT_READY_MIN_POLL_S = 0.1
+WAIT_READY_MAX_POLL_S = 2.0
+WAIT_READY_BACKOFF = 1.5
+DEFAULT_WAIT_TIMEOUT_MS = 60_000
+DEFAULT_EXEC_TIMEOUT_S = 120
+
+# Shared by every leaf in a fork tree; most nodes have no children.
+_NO_CHILDREN: tuple[str, ...] = ()
+
+# Chunk size for streaming file transfers in either direction.
+FILE_CHUNK_SIZE = 65_536
+
+
+def _iter_file(fp: BinaryIO) -> Iterator[bytes]:
+    while chunk := fp.read(FILE_CHUNK_SIZE):
+        yield chunk
+
+
+# C-level field extractors for the hot list-building loops below; one
+# itemgetter call replaces several string-keyed dict lookups per item.
+_FILE_FIELDS = itemgetter("name", "path", "type")
+_ARTIFACT_FIELDS = itemgetter("name", "path")
+_FORK_NODE_FIELDS = itemgetter("sandbox_id", "status")
+
+
+class Sandbox:
+    """A handle to one Sandchest sandbox.
+
+    Instances are returned by :class:`~sandchest.client.Sandchest`; they hold
+    no connection state of their own and share the client's HTTP transport.
+    Usable as a context manager — a still-running sandbox is stopped on exit.
+    """
+
+    def __init__(
+        self,
+        http: HttpClient,
+        sandbox_id: str,
+        status: str = "pending",
+        replay_url: str | None = None,
+        poll_interval_s: float | None = None,
+    ) -> None:
+        self._http = http
+        self.id = sandbox_id
+        self.status = status
+        self.replay_url = replay_url
+        # Endpoint paths are formatted once here; every method below does a
+        # plain string concat (or none at all) instead of re-running the
+        # f-string machinery on each call.
+        self._base = f"/v1/sandboxes/{sandbox_id}"
+        self._exec_url = self._base + "/exec"
+        self._files_url = self._base + "/files"
+        self._files_content_url = self._files_url + "/content"
+        # When set (via Sandchest or SANDCHEST_POLL_INTERVAL_MS), wait_ready
+        # polls at this fixed interval instead of the exponential schedule.
+        self._poll_interval_s = poll_interval_s
+        # Handles are built from a fresh API response, so the status starts
+        # inside the _get_status freshness window.
+        self._status_fetched_at = time.monotonic()
+
+    def __enter__(self) -> "Sandbox":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if self.status == "running":
+            self.stop()
+        return False
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def wait_ready(
+        self,
+        timeout_ms: int = DEFAULT_WAIT_TIMEOUT_MS,
+        *,
+        poll_interval: float | None = None,
+    ) -> "Sandbox":
+        """Poll until the sandbox is ``running``; raise on terminal states.
+
+        ``poll_interval`` (seconds) pins a fixed polling interval, overriding
+        both the instance default and the adaptive backoff schedule.
+        """
+        if poll_interval is None:
+            poll_interval = self._poll_interval_s
+        if self._get_status() == "running":
+            return self
+        # Prefer the server-push event stream: one HTTP request instead of N
+        # polls, and no sleep-induced gap between the sandbox transitioning
+        # and this call returning. Servers without the endpoint answer 404
+        # and we degrade to polling.
+        if self._wait_ready_stream():
+            return self
+        # Deadline tracking is all-integer nanoseconds: no floating-point
+        # rounding near the timeout edge, and the final sleep is capped to
+        # the remaining budget so we never over-sleep past it.
+        start_ns = time.perf_counter_ns()
+        timeout_ns = timeout_ms * 1_000_000
+        delay = poll_interval if poll_interval is not None else WAIT_READY_MIN_POLL_S
+        # Non-terminal polls are HEADs reading X-Sandbox-Status: no body on
+        # the wire and no JSON parse for the (N-1) ticks where nothing
+        # changed. The full GET only runs once the header reports a state
+        # worth acting on, or when the server predates the header.
+        use_head = True
+        while True:
+            status = None
+            if use_head:
+                head = self._http.request_head(self._base)
+                status = head.get("X-Sandbox-Status")
+                if status is None:
+                    use_head = False
+            if status is None or status in ("running", "failed", "stopped"):
+                res = self._http.request("GET", self._base)
+                self.status = res["status"]
+                self._status_fetched_at = time.monotonic()
+                if self.status == "running":
+                    return self
+                if self.status in ("failed", "stopped"):
+                    raise SandboxNotRunningError(
+                        f"sandbox {self.id} entered terminal state"
+                        f" {self.status!r} ({res.get('failure_reason')})"
+                    )
+            else:
+                self.status = status
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            if elapsed_ns >= timeout_ns:
+                raise SandchestError(
+                    f"sandbox {self.id} was not ready after {timeout_ms}ms"
+                )
+            remaining_s = (timeout_ns - elapsed_ns) / 1e9
+            time.sleep(min(delay * random.uniform(0.8, 1.2), remaining_s))
+            if poll_interval is None:
+                delay = min(delay * WAIT_READY_BACKOFF, WAIT_READY_MAX_POLL_S)
+
+    def _wait_ready_stream(self) -> bool:
+        """Consume the sandbox event stream until a terminal status.
+
+        Returns ``True`` once the sandbox is running and ``False`` when the
+        events endpoint is unavailable, the stream ends early, or the
+        connection drops — in all of which the caller falls back to
+        polling, whose GET requests retry and map errors the usual way.
+        Terminal states raise.
+        """
+        try:
+            with self._http.request_stream(
+                "GET",
+                self._base + "/events",
+                headers={"Accept": "text/event-stream"},
+            ) as response:
+                if response.status_code == 404:
+                    return False
+                for event in parse_sse(response):
+                    if event.get("t") != "status":
+                        continue
+                    self.status = event["status"]
+                    self._status_fetched_at = time.monotonic()
+                    if self.status == "running":
+                        return True
+                    if self.status in ("failed", "stopped"):
+                        raise SandboxNotRunningError(
+                            f"sandbox {self.id} entered terminal state"
+                            f" {self.status!r} ({event.get('failure_reason')})"
+                        )
+        except ConnectionError:
+            return False
+        return False
+
+    def refresh(self) -> "Sandbox":
+        """Re-fetch sandbox state from the API."""
+        res = self._http.request("GET", self._base)
+        self.status = res["status"]
+        self.replay_url = res.get("replay_url")
+        self._status_fetched_at = time.monotonic()
+        return self
+
+    def _get_status(self, max_age_s: float = 0.5) -> str:
+        """Return the sandbox status, refetching only when stale.
+
+        Back-to-back status checks (create → wait_ready → exec guards)
+        inside the freshness window reuse the last observed value instead of
+        issuing another GET.
+        """
+        if time.monotonic() - self._status_fetched_at < max_age_s:
+            return self.status
+        return self.refresh().status
+
+    def stop(self, *, wait: bool = True) -> None:
+        """Stop the sandbox. Stopped sandboxes cannot be restarted.
+
+        With ``wait=False`` the DELETE is issued from a daemon background
+        thread and this call returns immediately; failures are swallowed.
+        Useful when tearing down sandboxes on a latency-sensitive path.
+        """
+        if wait:
+            self._http.request("DELETE", self._base)
+        else:
+            threading.Thread(target=self._stop_quietly, daemon=True).start()
+        self.status = "stopped"
+        self._status_fetched_at = time.monotonic()
+
+    def _stop_quietly(self) -> None:
+        try:
+            self._http.request("DELETE", self._base)
+        except SandchestError:
+            pass
+
+    # -- exec --------------------------------------------------------------
+
+    def exec(
+        self,
+        cmd: str,
+        *,
+        cwd: str | None = None,
+        env: Mapping[str, str] | None = None,
+        timeout: int = DEFAULT_EXEC_TIMEOUT_S,
+        on_stdout: Callable[[str], None] | None = None,
+        on_stderr: Callable[[str], None] | None = None,
+        stream: bool = False,
+    ) -> ExecResult | ExecStream:
+        """Run a command in the sandbox.
+
+        By default blocks until the command exits and returns an
+        :class:`ExecResult`. Pass ``on_stdout``/``on_stderr`` callbacks to
+        receive output incrementally, or ``stream=True`` to get an
+        :class:`ExecStream` of raw events instead.
+        """
+        if stream:
+            return self._exec_stream(cmd, cwd, env, timeout)
+        if on_stdout is not None or on_stderr is not None:
+            return self._exec_with_callbacks(
+                cmd, cwd, env, timeout, on_stdout, on_stderr
+            )
+        return self._exec_blocking(cmd, cwd, env, timeout)
+
+    @staticmethod
+    def _exec_body(
+        cmd: str,
+        cwd: str | None,
+        env: Mapping[str, str] | None,
+        timeout: int,
+        wait: bool,
+    ) -> dict[str, Any]:
+        # Single allocation site for the exec request body shared by all
+        # three exec variants; new keys only need to be added here.
+        return {
+            "cmd": cmd,
+            "cwd": cwd,
+            "env": dict(env) if env else None,
+            "timeout_seconds": timeout,
+            "wait": wait,
+        }
+
+    def _exec_blocking(
+        self,
+        cmd: str,
+        cwd: str | None,
+        env: Mapping[str, str] | None,
+        timeout: int,
+    ) -> ExecResult:
+        res = self._http.request(
+            "POST",
+            self._exec_url,
+            body=self._exec_body(cmd, cwd, env, timeout, True),
+        )
+        return ExecResult.from_api(res)
+
+    def _exec_with_callbacks(
+        self,
+        cmd: str,
+        cwd: str | None,
+        env: Mapping[str, str] | None,
+        timeout: int,
+        on_stdout: Callable[[str], None] | None,
+        on_stderr: Callable[[str], None] | None,
+    ) -> ExecResult:
+        # Accumulate chunks in lists and join once at the end; repeated str
+        # concatenation recopies the whole prefix per event.
+        stdout_parts: list[str] = []
+        stderr_parts: list[str] = []
+        exit_code = 0
+        duration_ms = None
+
+        def _handle_stdout(event: dict[str, Any]) -> None:
+            stdout_parts.append(event["data"])
+            if on_stdout is not None:
+                on_stdout(event["data"])
+
+        def _handle_stderr(event: dict[str, Any]) -> None:
+            stderr_parts.append(event["data"])
+            if on_stderr is not None:
+                on_stderr(event["data"])
+
+        def _handle_exit(event: dict[str, Any]) -> None:
+            nonlocal exit_code, duration_ms
+            exit_code = event["code"]
+            duration_ms = event.get("duration_ms")
+
+        # One dict lookup per event instead of a chain of string compares;
+        # on stdout-heavy streams the if/elif walk is pure overhead.
+        dispatch = {
+            "stdout": _handle_stdout,
+            "stderr": _handle_stderr,
+            "exit": _handle_exit,
+        }.get
+
+        def _drain(exec_id: str, response) -> ExecResult:
+            for event in parse_sse(response):
+                handler = dispatch(event["t"])
+                if handler is not None:
+                    handler(event)
+            return ExecResult(
+                exec_id=exec_id,
+                exit_code=exit_code,
+                stdout="".join(stdout_parts),
+                stderr="".join(stderr_parts),
+                duration_ms=duration_ms,
+            )
+
+        body = self._exec_body(cmd, cwd, env, timeout, False)
+        # Single-dispatch fast path: ask the server to stream output events
+        # from the exec POST itself, saving the follow-up GET round-trip.
+        exec_id = None
+        with self._http.request_stream(
+            "POST",
+            self._exec_url,
+            body={**body, "stream": True},
+            headers={"Accept": "text/event-stream"},
+        ) as response:
+            content_type = response.headers.get("Content-Type", "")
+            if content_type.startswith("text/event-stream"):
+                return _drain(response.headers.get("X-Exec-Id", ""), response)
+            if response.is_success:
+                # A server that ignores ``stream`` has already started the
+                # exec and answered with the usual JSON envelope. Re-POSTing
+                # here would run the command a second time; attach to the
+                # exec this envelope names instead.
+                response.read()
+                exec_id = _loads(response.content)["exec_id"]
+        if exec_id is None:
+            # The probe failed outright, so no exec was created and retrying
+            # the POST through the regular request path is safe; it also
+            # maps error statuses the usual way.
+            res = self._http.request("POST", self._exec_url, body=body)
+            exec_id = res["exec_id"]
+        with self._http.request_stream(
+            "GET",
+            self._exec_url + f"/{exec_id}/stream",
+            headers={"Accept": "text/event-stream"},
+        ) as response:
+            return _drain(exec_id, response)
+
+    def _exec_stream(
+        self,
+        cmd: str,
+        cwd: str | None,
+        env: Mapping[str, str] | None,
+        timeout: int,
+    ) -> ExecStream:
+        res = self._http.request(
+            "POST",
+            self._exec_url,
+            body=self._exec_body(cmd, cwd, env, timeout, False),
+        )
+        exec_id = res["exec_id"]
+        response = self._http.request_stream(
+            "GET",
+            self._exec_url + f"/{exec_id}/stream",
+            headers={"Accept": "text/event-stream"},
+        )
+        return ExecStream(exec_id, response)
+
+    # -- files -------------------------------------------------------------
+
+    def ls(self, path: str = "/") -> list[FileEntry]:
+        """List files at ``path`` inside the sandbox."""
+        res = self._http.request(
+            "GET", self._files_url, query={"path": path}
+        )
+        return [
+            FileEntry(*_FILE_FIELDS(f), size_bytes=f.get("size_bytes"))
+            for f in res["files"]
+        ]
+
+    def upload(
+        self, path: str, content: bytes | BinaryIO | Iterable[bytes]
+    ) -> None:
+        """Write ``content`` to ``path`` inside the sandbox.
+
+        Accepts raw bytes, an open binary file, or an iterable of byte
+        chunks. Non-bytes inputs are streamed with chunked transfer
+        encoding, so network send overlaps disk reads and the file is never
+        fully resident in memory.
+        """
+        if hasattr(content, "read"):
+            content = _iter_file(content)
+        self._http.request_raw(
+            "PUT",
+            self._files_content_url,
+            content=content,
+            query={"path": path},
+            headers={"Content-Type": "application/octet-stream"},
+        )
+
+    def download(self, path: str) -> bytes:
+        """Read the file at ``path`` from the sandbox."""
+        response = self._http.request_raw(
+            "GET", self._files_content_url, query={"path": path}
+        )
+        return response.content
+
+    def download_to(self, path: str, dest: BinaryIO) -> None:
+        """Stream the file at ``path`` into the open binary file ``dest``.
+
+        Unlike :meth:`download`, the body never accumulates in memory — use
+        this for large artifacts.
+        """
+        with self._http.request_stream(
+            "GET",
+            self._files_content_url,
+            query={"path": path},
+        ) as response:
+            for chunk in response.iter_bytes(FILE_CHUNK_SIZE):
+                dest.write(chunk)
+
+    def rm(self, path: str) -> None:
+        """Delete the file or directory at ``path``."""
+        self._http.request(
+            "DELETE", self._files_url, query={"path": path}
+        )
+
+    # -- artifacts ---------------------------------------------------------
+
+    def list_artifacts(self) -> list[Artifact]:
+        """List the sandbox's registered artifacts."""
+        res = self._http.request("GET", self._base + "/artifacts")
+        return [
+            Artifact(*_ARTIFACT_FIELDS(a), size_bytes=a.get("size_bytes"))
+            for a in res["artifacts"]
+        ]
+
+    def register_artifacts(self, paths: Iterable[str]) -> RegisterArtifactsResult:
+        """Register output files so they survive sandbox teardown."""
+        res = self._http.request(
+            "POST",
+            self._base + "/artifacts",
+            body={"paths": list(paths)},
+        )
+        return RegisterArtifactsResult(
+            registered=res["registered"], total=res["total"]
+        )
+
+    # -- forks -------------------------------------------------------------
+
+    def fork(self) -> "Sandbox":
+        """Clone this sandbox's filesystem and memory into a new sandbox."""
+        res = self._http.request("POST", self._base + "/fork")
+        return Sandbox(
+            self._http,
+            res["sandbox_id"],
+            status=res["status"],
+            replay_url=res.get("replay_url"),
+            poll_interval_s=self._poll_interval_s,
+        )
+
+    def forks(self) -> ForkTree:
+        """Fetch the fork lineage rooted at this sandbox."""
+        res = self._http.request("GET", self._base + "/forks")
+        tree = [
+            ForkTreeNode(
+                *_FORK_NODE_FIELDS(n),
+                children=tuple(c) if (c := n.get("children")) else _NO_CHILDREN,
+            )
+            for n in res["nodes"]
+        ]
+        return ForkTree(root=res["root"], nodes=tree)
+
+    # -- sessions ----------------------------------------------------------
+
+    def create_session(
+        self,
+        *,
+        cwd: str | None = None,
+        env: Mapping[str, str] | None = None,
+    ) -> Session:
+        """Start a persistent shell session in the sandbox."""
+        res = self._http.request(
+            "POST",
+            self._base + "/sessions",
+            body={"cwd": cwd, "env": dict(env) if env else None},
+        )
+        return Session(self._http, self.id, res["session_id"])
@@ -0,0 +1,44 @@
+"""Persistent shell sessions inside a sandbox."""
+
+from __future__ import annotations
+
+from .http import HttpClient
+from .types import ExecResult
+
+DEFAULT_EXEC_TIMEOUT_S = 120
+
+
+class Session:
+    """A long-lived shell inside a sandbox.
+
+    Commands run in the same process environment, so shell state (cwd,
+    exported variables, background jobs) persists between ``exec`` calls.
+    Obtain one via :meth:`Sandbox.create_session`.
+    """
+
+    def __init__(self, http: HttpClient, sandbox_id: str, session_id: str) -> None:
+        self._http = http
+        self.sandbox_id = sandbox_id
+        self.id = session_id
+
+    def __enter__(self) -> "Session":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+    def exec(self, cmd: str, *, timeout: int = DEFAULT_EXEC_TIMEOUT_S) -> ExecResult:
+        """Run a command in the session and wait for it to finish."""
+        res = self._http.request(
+            "POST",
+            f"/v1/sandboxes/{self.sandbox_id}/sessions/{self.id}/exec",
+            body={"cmd": cmd, "timeout_seconds": timeout, "wait": True},
+        )
+        return ExecResult.from_api(res)
+
+    def close(self) -> None:
+        """Terminate the session's shell process."""
+        self._http.request(
+            "DELETE", f"/v1/sandboxes/{self.sandbox_id}/sessions/{self.id}"
+        )
@@ -0,0 +1,116 @@
+"""Result and event types returned by the Sandchest SDK.
+
+All dataclasses here use ``slots=True``: results are created in bulk (one
+per exec, one per listed file, one per fork-tree node), and slotted
+instances skip the per-object ``__dict__``, cutting memory and speeding up
+field access.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Literal, Mapping, TypedDict, Union
+
+
+@dataclass(frozen=True, slots=True)
+class ExecResult:
+    """Outcome of a completed command execution."""
+
+    exec_id: str
+    exit_code: int
+    stdout: str
+    stderr: str
+    duration_ms: int | None = None
+
+    @classmethod
+    def from_api(cls, res: Mapping[str, Any]) -> "ExecResult":
+        """Build a result from an exec API response payload."""
+        return cls(
+            exec_id=res["exec_id"],
+            exit_code=res["exit_code"],
+            stdout=res["stdout"],
+            stderr=res["stderr"],
+            duration_ms=res.get("duration_ms"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ExecResultBytes:
+    """Outcome of a completed command execution with output kept as bytes.
+
+    Returned by :meth:`~sandchest.stream.ExecStream.collect_bytes` for
+    pipelines that hash or store the output without ever needing text.
+    """
+
+    exec_id: str
+    exit_code: int
+    stdout: bytes
+    stderr: bytes
+    duration_ms: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class FileEntry:
+    """A file or directory listed inside a sandbox."""
+
+    name: str
+    path: str
+    type: str
+    size_bytes: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Artifact:
+    """A registered output artifact of a sandbox."""
+
+    name: str
+    path: str
+    size_bytes: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class RegisterArtifactsResult:
+    """How many of the requested paths were registered as artifacts."""
+
+    registered: int
+    total: int
+
+
+@dataclass(frozen=True, slots=True)
+class ForkTreeNode:
+    """One sandbox in a fork tree; ``children`` holds child sandbox IDs."""
+
+    sandbox_id: str
+    status: str
+    # A tuple keeps the node fully immutable and lets every leaf share one
+    # empty singleton instead of allocating a fresh list per node.
+    children: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class ForkTree:
+    """The fork lineage of a sandbox, rooted at ``root``."""
+
+    root: str
+    nodes: list[ForkTreeNode]
+
+
+class ExecStreamStdout(TypedDict):
+    t: Literal["stdout"]
+    seq: int
+    data: str
+
+
+class ExecStreamStderr(TypedDict):
+    t: Literal["stderr"]
+    seq: int
+    data: str
+
+
+class ExecStreamExit(TypedDict):
+    t: Literal["exit"]
+    code: int
+    duration_ms: int
+
+
+ExecStreamEvent = Union[ExecStreamStdout, ExecStreamStderr, ExecStreamExit]
@@ -0,0 +1,127 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sandchest.async_client import AsyncSandchest
+from sandchest.async_http import AsyncHttpClient
+from sandchest.async_sandbox import AsyncSandbox
+
+
+def make_client():
+    client = AsyncSandchest(api_key="sk_test")
+    client._http = MagicMock(spec=AsyncHttpClient)
+    return client
+
+
+class TestAsyncSandchest:
+    def test_create_returns_async_sandbox(self):
+        client = make_client()
+        client._http.request.return_value = {
+            "sandbox_id": "sb_1",
+            "status": "running",
+            "replay_url": None,
+        }
+        sandbox = asyncio.run(client.create())
+        assert isinstance(sandbox, AsyncSandbox)
+        assert sandbox.id == "sb_1"
+
+    def test_gather_fans_out_creates(self):
+        client = make_client()
+        client._http.request.return_value = {
+            "sandbox_id": "sb_1",
+            "status": "running",
+            "replay_url": None,
+        }
+
+        async def fan_out():
+            return await asyncio.gather(*[client.create() for _ in range(3)])
+
+        sandboxes = asyncio.run(fan_out())
+        assert len(sandboxes) == 3
+        assert client._http.request.call_count == 3
+
+
+class TestAsyncSandbox:
+    def test_exec_returns_result(self):
+        http = MagicMock(spec=AsyncHttpClient)
+        http.request.return_value = {
+            "exec_id": "ex_1",
+            "exit_code": 0,
+            "stdout": "hello\n",
+            "stderr": "",
+            "duration_ms": 12,
+        }
+        sandbox = AsyncSandbox(http, "sb_1", status="running")
+        result = asyncio.run(sandbox.exec("echo hello"))
+        assert result.stdout == "hello\n"
+
+    def test_context_manager_stops_running_sandbox(self):
+        http = MagicMock(spec=AsyncHttpClient)
+        http.request.return_value = None
+        sandbox = AsyncSandbox(http, "sb_1", status="running")
+
+        async def use():
+            async with sandbox:
+                pass
+
+        asyncio.run(use())
+        assert sandbox.status == "stopped"
+
+    def test_fork_returns_new_sandbox(self):
+        http = MagicMock(spec=AsyncHttpClient)
+        http.request.return_value = {
+            "sandbox_id": "sb_2",
+            "status": "running",
+            "replay_url": None,
+        }
+        sandbox = AsyncSandbox(http, "sb_1", status="running")
+        forked = asyncio.run(sandbox.fork())
+        assert isinstance(forked, AsyncSandbox)
+        assert forked.id == "sb_2"
+
+    def test_exec_stream_yields_events(self):
+        http = MagicMock(spec=AsyncHttpClient)
+        http.request.return_value = {"exec_id": "ex_1"}
+        ctx = http.request_stream.return_value
+        ctx.__aenter__ = AsyncMock(return_value=MagicMock())
+        ctx.__aexit__ = AsyncMock(return_value=False)
+        sandbox = AsyncSandbox(http, "sb_1", status="running")
+        events = [
+            {"t": "stdout", "seq": 0, "data": "hi"},
+            {"t": "exit", "code": 0, "duration_ms": 1},
+        ]
+
+        async def fake_aparse(response):
+            for event in events:
+                yield event
+
+        async def run():
+            return [e async for e in sandbox.exec_stream("ls")]
+
+        with patch("sandchest.async_sandbox.aparse_sse", fake_aparse):
+            got = asyncio.run(run())
+        assert got == events
+
+
+class TestAsyncSession:
+    def test_exec_runs_in_session(self):
+        http = MagicMock(spec=AsyncHttpClient)
+        http.request.side_effect = [
+            {"session_id": "sess_1"},
+            {
+                "exec_id": "ex_1",
+                "exit_code": 0,
+                "stdout": "/root\n",
+                "stderr": "",
+                "duration_ms": 4,
+            },
+        ]
+        sandbox = AsyncSandbox(http, "sb_1", status="running")
+
+        async def run():
+            session = await sandbox.create_session()
+            return await session.exec("pwd")
+
+        result = asyncio.run(run())
+        assert result.stdout == "/root\n"
+        args = http.request.call_args.args
+        assert args == ("POST", "/v1/sandboxes/sb_1/sessions/sess_1/exec")
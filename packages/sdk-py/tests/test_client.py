@@ -0,0 +1,121 @@
+from unittest.mock import MagicMock
+
+from sandchest import Sandchest
+from sandchest.http import HttpClient
+from sandchest.sandbox import Sandbox
+
+
+def make_client():
+    client = Sandchest(api_key="sk_test")
+    client._http = MagicMock(spec=HttpClient)
+    return client
+
+
+class TestCreate:
+    def test_returns_sandbox(self):
+        client = make_client()
+        client._http.request.return_value = {
+            "sandbox_id": "sb_1",
+            "status": "running",
+            "replay_url": "https://r.test.com/sb_1",
+        }
+        sandbox = client.create()
+        assert isinstance(sandbox, Sandbox)
+        assert sandbox.id == "sb_1"
+        assert sandbox.status == "running"
+
+    def test_sends_image_and_profile(self):
+        client = make_client()
+        client._http.request.return_value = {
+            "sandbox_id": "sb_1",
+            "status": "running",
+            "replay_url": None,
+        }
+        client.create(image="python", profile="large")
+        body = client._http.request.call_args.kwargs["body"]
+        assert body["image"] == "python"
+        assert body["profile"] == "large"
+
+
+class TestGet:
+    def test_returns_sandbox(self):
+        client = make_client()
+        client._http.request.return_value = {
+            "sandbox_id": "sb_1",
+            "status": "stopped",
+            "replay_url": None,
+        }
+        sandbox = client.get("sb_1")
+        assert sandbox.id == "sb_1"
+        assert sandbox.status == "stopped"
+
+
+class TestInterning:
+    def test_get_returns_same_instance_for_same_id(self):
+        client = make_client()
+        client._http.request.return_value = {
+            "sandbox_id": "sb_1",
+            "status": "pending",
+            "replay_url": None,
+        }
+        first = client.get("sb_1")
+        client._http.request.return_value = {
+            "sandbox_id": "sb_1",
+            "status": "running",
+            "replay_url": "https://r.test.com/sb_1",
+        }
+        second = client.get("sb_1")
+        assert second is first
+        assert first.status == "running"
+        assert first.replay_url == "https://r.test.com/sb_1"
+
+
+class TestStopMany:
+    def test_stops_every_sandbox(self):
+        client = make_client()
+        client._http.request.return_value = None
+        sandboxes = [
+            Sandbox(client._http, f"sb_{i}", status="running") for i in range(3)
+        ]
+        client.stop_many(sandboxes)
+        assert all(sb.status == "stopped" for sb in sandboxes)
+        assert client._http.request.call_count == 3
+
+    def test_empty_iterable_is_a_no_op(self):
+        client = make_client()
+        client.stop_many([])
+        client._http.request.assert_not_called()
+
+
+class TestList:
+    def test_follows_pagination(self):
+        client = make_client()
+        client._http.request.side_effect = [
+            {
+                "sandboxes": [
+                    {"sandbox_id": "sb_1", "status": "running"},
+                    {"sandbox_id": "sb_2", "status": "running"},
+                ],
+                "next_cursor": "cur_1",
+            },
+            {
+                "sandboxes": [{"sandbox_id": "sb_3", "status": "stopped"}],
+                "next_cursor": None,
+            },
+        ]
+        sandboxes = client.list()
+        assert [sb.id for sb in sandboxes] == ["sb_1", "sb_2", "sb_3"]
+        assert client._http.request.call_count == 2
+
+    def test_iter_sandboxes_stops_fetching_on_early_break(self):
+        client = make_client()
+        client._http.request.return_value = {
+            "sandboxes": [
+                {"sandbox_id": "sb_1", "status": "running"},
+                {"sandbox_id": "sb_2", "status": "running"},
+            ],
+            "next_cursor": "cur_1",
+        }
+        first = next(client.iter_sandboxes())
+        assert first.id == "sb_1"
+        assert client._http.request.call_count == 1
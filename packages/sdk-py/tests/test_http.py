@@ -0,0 +1,332 @@
+import json
+from functools import lru_cache
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from sandchest.errors import (
+    AuthenticationError,
+    ConnectionError,
+    NotFoundError,
+    RateLimitError,
+    SandboxNotRunningError,
+    SandchestError,
+    ValidationError,
+)
+from sandchest.http import HttpClient
+
+
+@pytest.fixture(scope="module")
+def client():
+    # Constructing an HttpClient (and its underlying httpx.Client with
+    # connection pool) is the most expensive line in each of these tests,
+    # so one shared instance serves the whole module. The transport is
+    # always mocked, so no state leaks between tests beyond the ETag cache,
+    # which only TestEtagCache's paths touch.
+    c = HttpClient(
+        api_key="sk_test",
+        base_url="https://api.test.com",
+        timeout=5.0,
+        retries=0,
+    )
+    yield c
+    c.close()
+
+
+@pytest.fixture
+def fresh_client():
+    # Retry tests assert exact transport call counts and vary the retry
+    # budget, so they get an isolated client instead of the shared one.
+    c = HttpClient(
+        api_key="sk_test",
+        base_url="https://api.test.com",
+        timeout=5.0,
+        retries=2,
+    )
+    yield c
+    c.close()
+
+
+@pytest.fixture(autouse=True)
+def mock_req(client, monkeypatch):
+    # One monkeypatched transport mock per test instead of a patch.object
+    # context manager in every body; monkeypatch restores the real method
+    # on teardown.
+    m = MagicMock()
+    monkeypatch.setattr(client._client, "request", m)
+    return m
+
+
+@lru_cache(maxsize=None)
+def _build_response(status_code, json_items, header_items):
+    content = json.dumps(dict(json_items)).encode() if json_items is not None else b""
+    all_headers = {"Content-Type": "application/json", **dict(header_items)}
+    return httpx.Response(status_code=status_code, content=content, headers=all_headers)
+
+
+def mock_response(status_code, json_data=None, headers=None):
+    # The same dozen payload literals recur across the suite; memoizing on
+    # their frozen contents means each distinct response is serialized and
+    # constructed once. Tests only read the shared instances.
+    json_items = tuple(json_data.items()) if json_data is not None else None
+    header_items = tuple(headers.items()) if headers else ()
+    return _build_response(status_code, json_items, header_items)
+
+
+# The generic success responses appear in nearly every test; bind the
+# shared instances once so the hot path is a plain name lookup with no
+# memoization key to build.
+_R_OK = mock_response(200, {"ok": True})
+_R_204 = mock_response(204)
+
+
+# Classes sharing the module-scoped client ride one xdist worker so the
+# expensive fixture is built once; TestRetries uses isolated clients and
+# is left ungrouped for the scheduler to scatter.
+@pytest.mark.xdist_group("http_client")
+class TestHeaders:
+    def test_sends_bearer_auth(self, client, mock_req):
+        mock_req.return_value = _R_OK
+        client.request("GET", "/v1/sandboxes")
+        headers = mock_req.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "Bearer sk_test"
+
+    def test_sends_json_content_type(self, client, mock_req):
+        mock_req.return_value = _R_OK
+        client.request("GET", "/v1/sandboxes")
+        headers = mock_req.call_args.kwargs["headers"]
+        assert headers["Content-Type"] == "application/json"
+        assert headers["Accept"] == "application/json"
+
+    def test_mutation_generates_idempotency_key(self, client, mock_req):
+        mock_req.return_value = _R_OK
+        client.request("POST", "/v1/sandboxes", body={})
+        headers = mock_req.call_args.kwargs["headers"]
+        assert len(headers["Idempotency-Key"]) == 32
+
+    def test_explicit_idempotency_key_is_used(self, client, mock_req):
+        mock_req.return_value = _R_OK
+        client.request("POST", "/v1/sandboxes", body={}, idempotency_key="key_123")
+        headers = mock_req.call_args.kwargs["headers"]
+        assert headers["Idempotency-Key"] == "key_123"
+
+    def test_get_sends_no_idempotency_key(self, client, mock_req):
+        mock_req.return_value = _R_OK
+        client.request("GET", "/v1/sandboxes")
+        headers = mock_req.call_args.kwargs["headers"]
+        assert "Idempotency-Key" not in headers
+
+    def test_extra_headers_are_merged(self, client, mock_req):
+        mock_req.return_value = _R_OK
+        client.request("GET", "/v1/sandboxes", headers={"X-Debug": "1"})
+        headers = mock_req.call_args.kwargs["headers"]
+        assert headers["X-Debug"] == "1"
+        assert headers["Authorization"] == "Bearer sk_test"
+
+
+@pytest.mark.xdist_group("http_client")
+class TestJsonParsing:
+    def test_returns_parsed_body(self, client, mock_req):
+        mock_req.return_value = mock_response(
+            200, {"sandbox_id": "sb_1", "status": "running"}
+        )
+        result = client.request("GET", "/v1/sandboxes/sb_1")
+        assert result == {"sandbox_id": "sb_1", "status": "running"}
+
+    def test_returns_none_on_204(self, client, mock_req):
+        mock_req.return_value = _R_204
+        result = client.request("DELETE", "/v1/sandboxes/sb_1")
+        assert result is None
+
+
+@pytest.mark.xdist_group("http_client")
+class TestQueryParams:
+    def test_stringifies_values(self, client, mock_req):
+        mock_req.return_value = _R_OK
+        client.request(
+            "GET", "/v1/sandboxes", query={"limit": 10, "status": "running"}
+        )
+        assert mock_req.call_args.kwargs["params"] == [
+            ("limit", "10"),
+            ("status", "running"),
+        ]
+
+    def test_serializes_bools_as_wire_values(self, client, mock_req):
+        mock_req.return_value = _R_OK
+        client.request("GET", "/v1/sandboxes", query={"replay_public": True})
+        assert mock_req.call_args.kwargs["params"] == [("replay_public", "true")]
+
+    def test_skips_none_values(self, client, mock_req):
+        mock_req.return_value = _R_OK
+        client.request("GET", "/v1/sandboxes", query={"limit": 10, "cursor": None})
+        assert mock_req.call_args.kwargs["params"] == [("limit", "10")]
+
+    def test_all_none_query_passes_none(self, client, mock_req):
+        mock_req.return_value = _R_OK
+        client.request("GET", "/v1/sandboxes", query={"cursor": None})
+        assert mock_req.call_args.kwargs["params"] is None
+
+    def test_no_query_passes_none(self, client, mock_req):
+        mock_req.return_value = _R_OK
+        client.request("GET", "/v1/sandboxes")
+        assert mock_req.call_args.kwargs["params"] is None
+
+
+@pytest.mark.xdist_group("http_client")
+class TestHead:
+    def test_returns_headers_on_success(self, client, mock_req):
+        mock_req.return_value = mock_response(
+            200, headers={"X-Sandbox-Status": "pending"}
+        )
+        headers = client.request_head("/v1/sandboxes/sb_head")
+        assert headers["X-Sandbox-Status"] == "pending"
+
+    # HEAD is a best-effort probe: servers without HEAD support and
+    # transient failures alike degrade to an empty mapping so the caller's
+    # GET fallback keeps polling instead of aborting.
+    @pytest.mark.parametrize("status", [404, 405, 429, 500])
+    def test_error_status_returns_empty(self, client, mock_req, status):
+        mock_req.return_value = mock_response(status)
+        assert client.request_head("/v1/sandboxes/sb_head") == {}
+
+    def test_network_error_returns_empty(self, client, mock_req):
+        mock_req.side_effect = httpx.ConnectError("boom")
+        assert client.request_head("/v1/sandboxes/sb_head") == {}
+
+
+@pytest.mark.xdist_group("http_client")
+class TestStream:
+    # Streaming is the one transport entry point that bypasses request();
+    # it must still honor the errors-module contract that connection
+    # failures surface as the SDK's ConnectionError, never raw httpx ones.
+    def test_maps_connect_errors(self, client, monkeypatch):
+        class _BoomCM:
+            def __enter__(self):
+                raise httpx.ConnectError("boom")
+
+            def __exit__(self, *exc):
+                return False
+
+        monkeypatch.setattr(client._client, "stream", lambda *a, **k: _BoomCM())
+        with pytest.raises(ConnectionError, match="boom"):
+            with client.request_stream("GET", "/v1/sandboxes/sb_1/events"):
+                pass
+
+    def test_maps_mid_stream_read_errors(self, client, monkeypatch):
+        class _Resp:
+            def iter_bytes(self, chunk_size=None):
+                yield b"da"
+                raise httpx.ReadError("dropped")
+
+        class _CM:
+            def __enter__(self):
+                return _Resp()
+
+            def __exit__(self, *exc):
+                return False
+
+        monkeypatch.setattr(client._client, "stream", lambda *a, **k: _CM())
+        with client.request_stream("GET", "/v1/sandboxes/sb_1/events") as response:
+            chunks = response.iter_bytes()
+            assert next(chunks) == b"da"
+            with pytest.raises(ConnectionError, match="dropped"):
+                next(chunks)
+
+
+@pytest.mark.xdist_group("http_client")
+class TestEtagCache:
+    def test_repeat_get_sends_if_none_match(self, client, mock_req):
+        mock_req.return_value = mock_response(
+            200, {"status": "pending"}, headers={"ETag": '"v1"'}
+        )
+        client.request("GET", "/v1/sandboxes/sb_etag")
+        client.request("GET", "/v1/sandboxes/sb_etag")
+        headers = mock_req.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+
+    def test_304_returns_cached_body(self, client, mock_req):
+        mock_req.side_effect = [
+            mock_response(200, {"status": "pending"}, headers={"ETag": '"v1"'}),
+            mock_response(304),
+        ]
+        first = client.request("GET", "/v1/sandboxes/sb_etag2")
+        second = client.request("GET", "/v1/sandboxes/sb_etag2")
+        assert second == first == {"status": "pending"}
+
+
+@pytest.mark.xdist_group("http_client")
+class TestErrorParsing:
+    # One parametrized body instead of six copy-pasted tests: identical
+    # coverage, and the per-test fixture setup runs once per ID.
+    @pytest.mark.parametrize(
+        "status,err,exc,extra",
+        [
+            (400, "validation_error", ValidationError, {"request_id": "req_1"}),
+            (401, "unauthorized", AuthenticationError, None),
+            (404, "not_found", NotFoundError, None),
+            (409, "sandbox_not_running", SandboxNotRunningError, None),
+            (429, "rate_limited", RateLimitError, {"retry_after": 10}),
+            (500, "internal_error", SandchestError, {"status": 500}),
+        ],
+    )
+    def test_status_raises_mapped_error(
+        self, client, mock_req, status, err, exc, extra
+    ):
+        payload = {"error": err, "message": "boom"}
+        # request_id/retry_after ride in the error envelope; the status
+        # attribute comes from the HTTP status itself.
+        if extra:
+            payload.update({k: v for k, v in extra.items() if k != "status"})
+        mock_req.return_value = mock_response(status, payload)
+        with pytest.raises(exc) as exc_info:
+            client.request("GET", "/v1/sandboxes")
+        for attr, expected in (extra or {}).items():
+            assert getattr(exc_info.value, attr) == expected
+
+
+class TestRetries:
+    @pytest.fixture(autouse=True)
+    def mock_req(self, fresh_client, monkeypatch):
+        # Overrides the module fixture: retry tests drive the isolated
+        # fresh_client, with backoff waits on the shutdown event no-op'd.
+        m = MagicMock()
+        monkeypatch.setattr(fresh_client._client, "request", m)
+        monkeypatch.setattr(fresh_client._shutdown, "wait", lambda *_: False)
+        return m
+
+    @pytest.mark.parametrize(
+        "failure",
+        [
+            mock_response(
+                429,
+                {"error": "rate_limited", "message": "slow down", "retry_after": 0},
+            ),
+            mock_response(500, {"error": "internal_error", "message": "oops"}),
+            httpx.ConnectError("connection refused"),
+        ],
+        ids=["429", "500", "network_error"],
+    )
+    def test_retries_then_succeeds(self, fresh_client, mock_req, failure):
+        mock_req.side_effect = [failure, _R_OK]
+        result = fresh_client.request("GET", "/v1/sandboxes")
+        assert result == {"ok": True}
+        assert mock_req.call_count == 2
+
+    def test_exhausted_retries_raise_last_error(self, fresh_client, mock_req):
+        fresh_client.retries = 1
+        mock_req.return_value = mock_response(
+            429,
+            {"error": "rate_limited", "message": "slow down", "retry_after": 0},
+        )
+        with pytest.raises(RateLimitError):
+            fresh_client.request("GET", "/v1/sandboxes")
+        assert mock_req.call_count == 2
+
+    def test_no_retry_on_400(self, fresh_client, mock_req):
+        mock_req.return_value = mock_response(
+            400, {"error": "validation_error", "message": "bad request"}
+        )
+        with pytest.raises(ValidationError):
+            fresh_client.request("POST", "/v1/sandboxes", body={})
+        assert mock_req.call_count == 1
@@ -0,0 +1,460 @@
+import io
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from sandchest import sandbox as _sb_mod
+from sandchest.errors import (
+    ConnectionError,
+    SandboxNotRunningError,
+    SandchestError,
+)
+from sandchest.sandbox import Sandbox
+from sandchest.session import Session
+from sandchest.stream import ExecStream
+from sandchest.types import FileEntry, ForkTreeNode
+
+# Sandbox tests share no mutable state but do share the stub classes and
+# payload constants below; keep them on one xdist worker under
+# --dist=loadgroup while other files fan out.
+pytestmark = pytest.mark.xdist_group("sandbox")
+
+
+class _Call:
+    """Minimal stand-in for a mocked method.
+
+    Records calls and plays back ``return_value`` or a ``side_effect``
+    list, without the per-construction spec introspection that makes
+    ``MagicMock(spec=HttpClient)`` the slowest line in each test.
+    """
+
+    def __init__(self, return_value=None):
+        self.return_value = return_value
+        self.side_effect = None
+        self.call_args = None
+        self.call_count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.call_count += 1
+        self.call_args = SimpleNamespace(args=args, kwargs=kwargs)
+        if self.side_effect is not None:
+            value = self.side_effect.pop(0)
+            if isinstance(value, Exception):
+                raise value
+            return value
+        return self.return_value
+
+    def assert_not_called(self):
+        assert self.call_count == 0
+
+
+class _StreamResponse:
+    """Streaming-response double; doubles as its own context manager."""
+
+    def __init__(self):
+        self.status_code = 404
+        self.headers = {}
+        self.content = b""
+        self.iter_bytes = _Call(return_value=iter(()))
+
+    @property
+    def is_success(self):
+        return 200 <= self.status_code < 300
+
+    def read(self):
+        return self.content
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class _HttpStub:
+    """Hand-written HttpClient double exposing just the transport surface
+    the Sandbox/Session code calls.
+
+    Defaults mirror a server without the optional fast paths: the events
+    endpoint 404s, streaming responses carry no headers, and HEAD polls
+    omit the status header — so wait_ready and callback exec exercise
+    their polling/two-step fallbacks unless a test overrides them via
+    ``stream_response``.
+    """
+
+    def __init__(self):
+        self.request = _Call()
+        self.request_head = _Call(return_value={})
+        self.request_raw = _Call()
+        self.stream_response = _StreamResponse()
+        self.request_stream = _Call(return_value=self.stream_response)
+
+
+# One canonical sandbox-detail payload; tests build variants with a
+# shallow {**_SB_DETAIL, ...} copy instead of re-allocating the full
+# 13-key literal, and schema changes are one-touch.
+_SB_DETAIL = {
+    "sandbox_id": "sb_test",
+    "image": "ubuntu",
+    "profile": "small",
+    "env": {},
+    "forked_from": None,
+    "fork_count": 0,
+    "created_at": "2024-01-01T00:00:00Z",
+    "started_at": "2024-01-01T00:00:01Z",
+    "ended_at": None,
+    "failure_reason": None,
+    "replay_url": "https://r.test.com/sb_test",
+    "replay_public": False,
+    "status": "running",
+}
+_SB_PENDING = {**_SB_DETAIL, "status": "pending", "started_at": None}
+
+# Exec-result skeleton shared by the blocking-exec tests.
+_EXEC_RESULT = {
+    "exec_id": "ex_1",
+    "exit_code": 0,
+    "stdout": "",
+    "stderr": "",
+    "duration_ms": 1,
+}
+
+
+def make_sandbox(status="running"):
+    return Sandbox(
+        _HttpStub(), "sb_test", status=status, replay_url="https://r.test.com/sb_test"
+    )
+
+
+class TestWaitReady:
+    def test_returns_when_running(self):
+        sb = make_sandbox(status="pending")
+        sb._http.request.return_value = _SB_DETAIL
+        result = sb.wait_ready()
+        assert result is sb
+        assert sb.status == "running"
+
+    def test_polls_until_running(self, monkeypatch):
+        sb = make_sandbox(status="pending")
+        pending = _SB_PENDING
+        running = dict(pending, status="running", started_at="2024-01-01T00:00:02Z")
+        sb._http.request.side_effect = [pending, pending, running]
+        monkeypatch.setattr(_sb_mod.time, "sleep", lambda *_: None)
+        sb.wait_ready()
+        assert sb._http.request.call_count == 3
+        assert sb.status == "running"
+
+    def test_raises_on_failure(self):
+        sb = make_sandbox(status="pending")
+        sb._http.request.return_value = {
+            **_SB_DETAIL,
+            "status": "failed",
+            "started_at": None,
+            "ended_at": "2024-01-01T00:00:05Z",
+            "failure_reason": "provision_failed",
+        }
+        with pytest.raises(SandboxNotRunningError, match="provision_failed"):
+            sb.wait_ready()
+
+    def test_times_out(self, monkeypatch):
+        sb = make_sandbox(status="pending")
+        sb._http.request.return_value = _SB_PENDING
+        # perf_counter_ns is read once for the start mark and once for the
+        # deadline check after the first poll.
+        ticks = iter([0, 100_000_000_000])
+        monkeypatch.setattr(_sb_mod.time, "perf_counter_ns", lambda: next(ticks))
+        with pytest.raises(SandchestError, match="not ready"):
+            sb.wait_ready(timeout_ms=60_000)
+
+    def test_fixed_poll_interval_disables_backoff(self, monkeypatch):
+        sb = make_sandbox(status="pending")
+        pending = _SB_PENDING
+        running = dict(pending, status="running", started_at="2024-01-01T00:00:02Z")
+        sb._http.request.side_effect = [pending, pending, running]
+        sleeps = []
+        monkeypatch.setattr(_sb_mod.time, "sleep", sleeps.append)
+        sb.wait_ready(poll_interval=5.0)
+        for delay in sleeps:
+            assert 5.0 * 0.8 <= delay <= 5.0 * 1.2
+
+    def test_polls_with_head_when_header_present(self, monkeypatch):
+        sb = make_sandbox(status="pending")
+        sb._http.request_head.side_effect = [
+            {"X-Sandbox-Status": "pending"},
+            {"X-Sandbox-Status": "running"},
+        ]
+        sb._http.request.return_value = _SB_DETAIL
+        monkeypatch.setattr(_sb_mod.time, "sleep", lambda *_: None)
+        sb.wait_ready()
+        assert sb._http.request_head.call_count == 2
+        assert sb._http.request.call_count == 1
+        assert sb.status == "running"
+
+    def test_uses_event_stream_when_available(self, monkeypatch):
+        sb = make_sandbox(status="pending")
+        sb._http.stream_response.status_code = 200
+        events = [
+            {"t": "status", "status": "pending"},
+            {"t": "status", "status": "running"},
+        ]
+        monkeypatch.setattr(_sb_mod, "parse_sse", lambda _resp: iter(events))
+        result = sb.wait_ready()
+        assert result is sb
+        assert sb.status == "running"
+        sb._http.request.assert_not_called()
+
+    def test_degrades_to_polling_on_stream_error(self):
+        # A dropped /events connection must not abort wait_ready; the
+        # polling loop takes over and its GETs retry the usual way.
+        sb = make_sandbox(status="pending")
+        sb._http.request_stream.side_effect = [ConnectionError("boom")]
+        sb._http.request.return_value = _SB_DETAIL
+        result = sb.wait_ready()
+        assert result is sb
+        assert sb.status == "running"
+        assert sb._http.request.call_count == 1
+
+
+class TestExecBlocking:
+    def test_returns_result(self):
+        sb = make_sandbox()
+        sb._http.request.return_value = {
+            **_EXEC_RESULT,
+            "stdout": "hello\n",
+            "duration_ms": 12,
+        }
+        result = sb.exec("echo hello")
+        assert result.exec_id == "ex_1"
+        assert result.exit_code == 0
+        assert result.stdout == "hello\n"
+        assert result.duration_ms == 12
+
+    def test_sends_wait_true(self):
+        sb = make_sandbox()
+        sb._http.request.return_value = _EXEC_RESULT
+        sb.exec("ls")
+        body = sb._http.request.call_args.kwargs["body"]
+        assert body["cmd"] == "ls"
+        assert body["wait"] is True
+
+    def test_passes_cwd_and_env(self):
+        sb = make_sandbox()
+        sb._http.request.return_value = _EXEC_RESULT
+        sb.exec("ls", cwd="/tmp", env={"FOO": "bar"})
+        body = sb._http.request.call_args.kwargs["body"]
+        assert body["cwd"] == "/tmp"
+        assert body["env"] == {"FOO": "bar"}
+
+
+class TestExecWithCallbacks:
+    def test_invokes_callbacks(self, monkeypatch):
+        sb = make_sandbox()
+        sb._http.request.return_value = {"exec_id": "ex_1"}
+        events = [
+            {"t": "stdout", "seq": 0, "data": "hel"},
+            {"t": "stdout", "seq": 1, "data": "lo"},
+            {"t": "stderr", "seq": 2, "data": "warn"},
+            {"t": "exit", "code": 0, "duration_ms": 5},
+        ]
+        out, err = [], []
+        monkeypatch.setattr(_sb_mod, "parse_sse", lambda _resp: iter(events))
+        sb.exec("echo hello", on_stdout=out.append, on_stderr=err.append)
+        assert out == ["hel", "lo"]
+        assert err == ["warn"]
+
+    def test_collects_output_and_exit(self, monkeypatch):
+        sb = make_sandbox()
+        sb._http.request.return_value = {"exec_id": "ex_1"}
+        events = [
+            {"t": "stdout", "seq": 0, "data": "hel"},
+            {"t": "stdout", "seq": 1, "data": "lo"},
+            {"t": "exit", "code": 3, "duration_ms": 8},
+        ]
+        monkeypatch.setattr(_sb_mod, "parse_sse", lambda _resp: iter(events))
+        result = sb.exec("echo hello", on_stdout=lambda _: None)
+        assert result.stdout == "hello"
+        assert result.exit_code == 3
+        assert result.duration_ms == 8
+
+    def test_streams_from_post_when_server_supports_it(self, monkeypatch):
+        sb = make_sandbox()
+        sb._http.stream_response.headers = {
+            "Content-Type": "text/event-stream",
+            "X-Exec-Id": "ex_9",
+        }
+        events = [
+            {"t": "stdout", "seq": 0, "data": "hi"},
+            {"t": "exit", "code": 0, "duration_ms": 2},
+        ]
+        monkeypatch.setattr(_sb_mod, "parse_sse", lambda _resp: iter(events))
+        result = sb.exec("echo hi", on_stdout=lambda _: None)
+        assert result.exec_id == "ex_9"
+        assert result.stdout == "hi"
+        # The exec POST itself carried the stream; no follow-up requests.
+        sb._http.request.assert_not_called()
+        assert sb._http.request_stream.call_count == 1
+        kwargs = sb._http.request_stream.call_args.kwargs
+        assert kwargs["body"]["stream"] is True
+
+    def test_attaches_when_server_ignores_stream_flag(self, monkeypatch):
+        sb = make_sandbox()
+        resp = sb._http.stream_response
+        resp.status_code = 200
+        resp.headers = {"Content-Type": "application/json"}
+        resp.content = b'{"exec_id": "ex_7"}'
+        events = [{"t": "exit", "code": 0, "duration_ms": 1}]
+        monkeypatch.setattr(_sb_mod, "parse_sse", lambda _resp: iter(events))
+        result = sb.exec("echo hi", on_stdout=lambda _: None)
+        assert result.exec_id == "ex_7"
+        # The probe POST already started the exec; attaching must not
+        # create a second one.
+        sb._http.request.assert_not_called()
+        assert sb._http.request_stream.call_count == 2
+        args = sb._http.request_stream.call_args.args
+        assert args == ("GET", "/v1/sandboxes/sb_test/exec/ex_7/stream")
+
+
+class TestExecStream:
+    def test_returns_stream(self):
+        sb = make_sandbox()
+        sb._http.request.return_value = {"exec_id": "ex_1"}
+        stream = sb.exec("ls", stream=True)
+        assert isinstance(stream, ExecStream)
+        assert stream.exec_id == "ex_1"
+        body = sb._http.request.call_args.kwargs["body"]
+        assert body["wait"] is False
+
+
+class TestFiles:
+    def test_ls_returns_entries(self):
+        sb = make_sandbox()
+        sb._http.request.return_value = {
+            "files": [
+                {"name": "a.txt", "path": "/a.txt", "type": "file", "size_bytes": 3},
+                {"name": "d", "path": "/d", "type": "dir"},
+            ]
+        }
+        entries = sb.ls("/")
+        assert entries == [
+            FileEntry(name="a.txt", path="/a.txt", type="file", size_bytes=3),
+            FileEntry(name="d", path="/d", type="dir", size_bytes=None),
+        ]
+
+    def test_upload_sends_content(self):
+        sb = make_sandbox()
+        sb.upload("/tmp/a.txt", b"hello")
+        kwargs = sb._http.request_raw.call_args.kwargs
+        assert kwargs["content"] == b"hello"
+        assert kwargs["query"] == {"path": "/tmp/a.txt"}
+
+    def test_upload_streams_file_objects(self):
+        sb = make_sandbox()
+        sb.upload("/tmp/a.txt", io.BytesIO(b"hello"))
+        content = sb._http.request_raw.call_args.kwargs["content"]
+        assert b"".join(content) == b"hello"
+
+    def test_download_returns_bytes(self):
+        sb = make_sandbox()
+        sb._http.request_raw.return_value = httpx.Response(200, content=b"data")
+        assert sb.download("/tmp/a.txt") == b"data"
+
+    def test_download_to_streams_chunks(self):
+        sb = make_sandbox()
+        sb._http.stream_response.iter_bytes.return_value = iter([b"da", b"ta"])
+        dest = io.BytesIO()
+        sb.download_to("/tmp/a.txt", dest)
+        assert dest.getvalue() == b"data"
+        kwargs = sb._http.request_stream.call_args.kwargs
+        assert kwargs["query"] == {"path": "/tmp/a.txt"}
+
+
+class TestLifecycle:
+    def test_get_status_uses_freshness_window(self):
+        sb = make_sandbox(status="running")
+        assert sb._get_status() == "running"
+        sb._http.request.assert_not_called()
+        sb._status_fetched_at -= 1.0
+        sb._http.request.return_value = {
+            "sandbox_id": "sb_test",
+            "status": "stopped",
+            "replay_url": None,
+        }
+        assert sb._get_status() == "stopped"
+        assert sb._http.request.call_count == 1
+
+    def test_stop_marks_stopped(self):
+        sb = make_sandbox(status="running")
+        sb.stop()
+        assert sb.status == "stopped"
+        args = sb._http.request.call_args.args
+        assert args == ("DELETE", "/v1/sandboxes/sb_test")
+
+    def test_stop_no_wait_defers_to_background_thread(self, monkeypatch):
+        sb = make_sandbox(status="running")
+        started = []
+
+        class _FakeThread:
+            def __init__(self, target=None, daemon=False):
+                self.target = target
+
+            def start(self):
+                started.append(self)
+
+        monkeypatch.setattr(_sb_mod.threading, "Thread", _FakeThread)
+        sb.stop(wait=False)
+        assert sb.status == "stopped"
+        assert len(started) == 1
+        sb._http.request.assert_not_called()
+
+    def test_context_manager_stops_running_sandbox(self):
+        sb = make_sandbox(status="running")
+        with sb:
+            pass
+        assert sb.status == "stopped"
+        assert sb._http.request.call_count == 1
+
+    def test_context_manager_skips_stopped_sandbox(self):
+        sb = make_sandbox(status="stopped")
+        with sb:
+            pass
+        assert sb._http.request.call_count == 0
+
+
+class TestForks:
+    def test_fork_returns_new_sandbox(self):
+        sb = make_sandbox()
+        sb._http.request.return_value = {
+            "sandbox_id": "sb_child",
+            "status": "running",
+            "replay_url": "https://r.test.com/sb_child",
+        }
+        child = sb.fork()
+        assert child.id == "sb_child"
+        assert child._http is sb._http
+
+    def test_forks_builds_tree(self):
+        sb = make_sandbox()
+        sb._http.request.return_value = {
+            "root": "sb_test",
+            "nodes": [
+                {"sandbox_id": "sb_test", "status": "running", "children": ["sb_a"]},
+                {"sandbox_id": "sb_a", "status": "running"},
+            ],
+        }
+        tree = sb.forks()
+        assert tree.root == "sb_test"
+        assert tree.nodes[0] == ForkTreeNode(
+            sandbox_id="sb_test", status="running", children=("sb_a",)
+        )
+        assert tree.nodes[1].children == ()
+
+
+class TestSessions:
+    def test_create_session(self):
+        sb = make_sandbox()
+        sb._http.request.return_value = {"session_id": "ses_1"}
+        session = sb.create_session(cwd="/work")
+        assert isinstance(session, Session)
+        assert session.id == "ses_1"
+        assert session.sandbox_id == "sb_test"
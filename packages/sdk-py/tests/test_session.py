@@ -0,0 +1,49 @@
+from test_sandbox import _HttpStub
+
+from sandchest.session import Session
+
+
+def make_session():
+    return Session(_HttpStub(), "sb_test", "ses_test")
+
+
+class TestSession:
+    def test_exec_posts_to_session_path(self):
+        session = make_session()
+        session._http.request.return_value = {
+            "exec_id": "ex_1",
+            "exit_code": 0,
+            "stdout": "hello\n",
+            "stderr": "",
+            "duration_ms": 12,
+        }
+        session.exec("echo hello")
+        args = session._http.request.call_args.args
+        assert args == ("POST", "/v1/sandboxes/sb_test/sessions/ses_test/exec")
+        body = session._http.request.call_args.kwargs["body"]
+        assert body["cmd"] == "echo hello"
+
+    def test_exec_returns_result(self):
+        session = make_session()
+        session._http.request.return_value = {
+            "exec_id": "ex_1",
+            "exit_code": 2,
+            "stdout": "",
+            "stderr": "boom",
+            "duration_ms": 4,
+        }
+        result = session.exec("false")
+        assert result.exit_code == 2
+        assert result.stderr == "boom"
+
+    def test_close_deletes_session(self):
+        session = make_session()
+        session.close()
+        args = session._http.request.call_args.args
+        assert args == ("DELETE", "/v1/sandboxes/sb_test/sessions/ses_test")
+
+    def test_context_manager_closes(self):
+        session = make_session()
+        with session:
+            pass
+        assert session._http.request.call_count == 1
@@ -0,0 +1,204 @@
+import io
+import json
+import time
+
+import pytest
+
+from sandchest import stream as _stream_mod
+from sandchest.stream import ExecStream, parse_sse
+
+
+class FakeResponse:
+    """BytesIO-backed response double with a real chunked ``iter_bytes``.
+
+    Unlike a preset mock iterator, this exercises the same byte-granular
+    chunk boundaries httpx produces, so buffer-stitching bugs in the
+    parser show up here.
+    """
+
+    def __init__(self, payload: bytes, chunk_size: int = 8192):
+        self._stream = io.BytesIO(payload)
+        self._chunk_size = chunk_size
+
+    def iter_bytes(self, chunk_size: int | None = None):
+        size = chunk_size or self._chunk_size
+        while chunk := self._stream.read(size):
+            yield chunk
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+def make_sse_response(text, chunk_size=8192):
+    return FakeResponse(text.encode(), chunk_size=chunk_size)
+
+
+def sse(events):
+    return "".join(f"data: {json.dumps(e)}\n\n" for e in events)
+
+
+class TestParseSSE:
+    def test_parses_single_event(self):
+        response = make_sse_response(sse([{"t": "stdout", "seq": 0, "data": "hi"}]))
+        events = list(parse_sse(response))
+        assert events == [{"t": "stdout", "seq": 0, "data": "hi"}]
+
+    def test_parses_multiple_events(self):
+        response = make_sse_response(
+            sse(
+                [
+                    {"t": "stdout", "seq": 0, "data": "a"},
+                    {"t": "stderr", "seq": 1, "data": "b"},
+                    {"t": "exit", "code": 0, "duration_ms": 3},
+                ]
+            )
+        )
+        events = list(parse_sse(response))
+        assert len(events) == 3
+        assert events[2]["t"] == "exit"
+
+    def test_ignores_non_data_lines(self):
+        text = (
+            ": keep-alive\n\n"
+            "event: message\n"
+            'data: {"t": "stdout", "seq": 0, "data": "hi"}\n\n'
+            "id: 42\n\n"
+        )
+        events = list(parse_sse(make_sse_response(text)))
+        assert events == [{"t": "stdout", "seq": 0, "data": "hi"}]
+
+    def test_skips_empty_data(self):
+        text = "data:\n\n" + 'data: {"t": "exit", "code": 0, "duration_ms": 1}\n\n'
+        events = list(parse_sse(make_sse_response(text)))
+        assert events == [{"t": "exit", "code": 0, "duration_ms": 1}]
+
+    def test_handles_chunked_delivery(self):
+        text = sse(
+            [
+                {"t": "stdout", "seq": 0, "data": "hello"},
+                {"t": "exit", "code": 0, "duration_ms": 2},
+            ]
+        )
+        events = list(parse_sse(make_sse_response(text, chunk_size=7)))
+        assert len(events) == 2
+        assert events[0]["data"] == "hello"
+
+    def test_parse_sse_is_lazy(self):
+        # Events are yielded as soon as their terminator arrives;
+        # consuming only the first must not drain the rest of the stream.
+        text = sse([{"t": "stdout", "seq": i, "data": "x"} for i in range(10)])
+        response = make_sse_response(text, chunk_size=40)
+        total = (len(text) + 39) // 40
+        pulled = 0
+        inner = response.iter_bytes
+
+        def counting_iter_bytes(chunk_size=None):
+            nonlocal pulled
+            for chunk in inner(chunk_size):
+                pulled += 1
+                yield chunk
+
+        response.iter_bytes = counting_iter_bytes
+        first = next(parse_sse(response))
+        assert first["seq"] == 0
+        assert pulled < total
+
+    def test_lazy_event_defers_parse(self):
+        # The first payload is not valid JSON; with lazy=True that only
+        # matters if the consumer actually reads a key from it.
+        text = (
+            "data: {not json}\n\n"
+            'data: {"t": "exit", "code": 0, "duration_ms": 1}\n\n'
+        )
+        events = list(parse_sse(make_sse_response(text), lazy=True))
+        assert len(events) == 2
+        assert events[1]["t"] == "exit"
+        with pytest.raises(ValueError):
+            events[0]["t"]
+
+    def test_parse_sse_uses_fast_json(self, monkeypatch):
+        # Decoding goes through the module-level _loads indirection, so a
+        # faster decoder (msgspec/orjson/ujson) is honored when installed.
+        calls = []
+
+        def spy(data):
+            calls.append(data)
+            return json.loads(data)
+
+        monkeypatch.setattr(_stream_mod, "_loads", spy)
+        text = sse([{"t": "exit", "code": 0, "duration_ms": 1}])
+        events = list(parse_sse(make_sse_response(text)))
+        assert len(calls) == 1
+        assert events == [{"t": "exit", "code": 0, "duration_ms": 1}]
+
+    def test_handles_megabyte_event(self):
+        # A single multi-MB event delivered in 64 KB chunks must not
+        # re-scan the accumulated buffer per chunk; the generous bound
+        # only trips on quadratic behavior.
+        text = sse([{"t": "stdout", "seq": 0, "data": "x" * (4 * 1024 * 1024)}])
+        start = time.perf_counter()
+        events = list(parse_sse(make_sse_response(text, chunk_size=65_536)))
+        assert time.perf_counter() - start < 5.0
+        assert len(events[0]["data"]) == 4 * 1024 * 1024
+
+
+class TestBackend:
+    def test_backend_selected(self):
+        assert _stream_mod.BACKEND in _stream_mod._BACKENDS
+        assert parse_sse is _stream_mod._BACKENDS[_stream_mod.BACKEND]
+
+
+class TestExecStream:
+    def test_collect(self):
+        response = make_sse_response(
+            sse(
+                [
+                    {"t": "stdout", "seq": 0, "data": "hello "},
+                    {"t": "stdout", "seq": 1, "data": "world"},
+                    {"t": "stderr", "seq": 2, "data": "warn"},
+                    {"t": "exit", "code": 3, "duration_ms": 8},
+                ]
+            )
+        )
+        result = ExecStream("ex_1", response).collect()
+        assert result.exec_id == "ex_1"
+        assert result.stdout == "hello world"
+        assert result.stderr == "warn"
+        assert result.exit_code == 3
+        assert result.duration_ms == 8
+
+    def test_collect_empty_stream(self):
+        result = ExecStream("ex_1", make_sse_response("")).collect()
+        assert result.stdout == ""
+        assert result.stderr == ""
+        assert result.exit_code == 0
+
+    def test_collect_bytes(self):
+        response = make_sse_response(
+            sse(
+                [
+                    {"t": "stdout", "seq": 0, "data": "hello "},
+                    {"t": "stdout", "seq": 1, "data": "world"},
+                    {"t": "stderr", "seq": 2, "data": "warn"},
+                    {"t": "exit", "code": 3, "duration_ms": 8},
+                ]
+            )
+        )
+        result = ExecStream("ex_1", response).collect_bytes()
+        assert result.stdout == b"hello world"
+        assert result.stderr == b"warn"
+        assert result.exit_code == 3
+
+    def test_collect_large_stream_is_linear(self):
+        # 50k events would take minutes under quadratic str concatenation;
+        # the generous wall-clock bound only trips on O(n^2) regressions.
+        events = [{"t": "stdout", "seq": i, "data": "x" * 20} for i in range(50_000)]
+        events.append({"t": "exit", "code": 0, "duration_ms": 1})
+        response = make_sse_response(sse(events))
+        start = time.perf_counter()
+        result = ExecStream("ex_1", response).collect()
+        assert time.perf_counter() - start < 5.0
+        assert len(result.stdout) == 50_000 * 20
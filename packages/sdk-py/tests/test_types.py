@@ -0,0 +1,38 @@
+import dataclasses
+
+import pytest
+
+from sandchest.types import Artifact, ExecResult, FileEntry
+
+
+class TestImmutability:
+    def test_exec_result_is_frozen(self):
+        result = ExecResult(exec_id="ex_1", exit_code=0, stdout="", stderr="")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.exit_code = 1
+
+    def test_file_entry_is_frozen(self):
+        entry = FileEntry(name="a.txt", path="/a.txt", type="file")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            entry.name = "b.txt"
+
+
+class TestSlots:
+    def test_has_slots(self):
+        # slots=True drops the per-instance __dict__; consumers collecting
+        # thousands of entries rely on the smaller footprint.
+        result = ExecResult(exec_id="ex_1", exit_code=0, stdout="", stderr="")
+        entry = FileEntry(name="a.txt", path="/a.txt", type="file")
+        artifact = Artifact(name="out.bin", path="/out.bin")
+        for instance in (result, entry, artifact):
+            assert not hasattr(instance, "__dict__")
+
+
+class TestDefaults:
+    def test_exec_result_duration_defaults_none(self):
+        result = ExecResult(exec_id="ex_1", exit_code=0, stdout="", stderr="")
+        assert result.duration_ms is None
+
+    def test_artifact_size_defaults_none(self):
+        artifact = Artifact(name="out.bin", path="/out.bin")
+        assert artifact.size_bytes is None